@@ -13,6 +13,7 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from src.scheduler import ShutdownScheduler
 from src.config import TASK_NAME
+from tests.support import fake_popen
 
 
 def test_bug_scenario():
@@ -30,8 +31,10 @@ def test_bug_scenario():
     # 模擬Windows任務排程器返回的任務列表（包含我們的任務）
     mock_task_list = f'"Task Name","Status"\n"{TASK_NAME}","Running"'
 
-    with patch("src.scheduler.subprocess.run") as mock_run:
-        mock_run.return_value = MagicMock(returncode=0, stdout=mock_task_list)
+    with patch("src.scheduler.subprocess.Popen", side_effect=fake_popen), patch(
+        "src.scheduler.subprocess.run"
+    ) as mock_run:
+        mock_run.return_value = MagicMock(returncode=0, stdout=mock_task_list.encode())
 
         result = scheduler.has_active_schedule()
         print(f"任務列表: {repr(mock_task_list)}")
@@ -51,7 +54,9 @@ Last Run Time: N/A
 Last Result: 0
 Run As User: SYSTEM"""
 
-    with patch("src.scheduler.subprocess.run") as mock_run:
+    with patch("src.scheduler.subprocess.Popen", side_effect=fake_popen), patch(
+        "src.scheduler.subprocess.run"
+    ) as mock_run:
         # 第一次調用：列出任務
         mock_run.side_effect = [
             MagicMock(returncode=0, stdout=mock_task_list),  # 任務列表
@@ -102,13 +107,7 @@ Run As User: SYSTEM"""
     ]
 
     for task_name, should_match, description in test_cases:
-        normalized_name = task_name.lstrip("\\")
-        matches = (
-            normalized_name == TASK_NAME
-            or normalized_name in scheduler.possible_task_names
-            or task_name == TASK_NAME
-            or task_name in scheduler.possible_task_names
-        )
+        matches = scheduler._match_task(task_name)
         status = "PASS" if matches == should_match else "FAIL"
         print(
             f"{status} {description}: '{task_name}' -> {matches} (預期: {should_match})"
@@ -33,15 +33,8 @@ print("任務名稱匹配測試:")
 print("-" * 60)
 
 for task_name, should_match, description in test_cases:
-    # 模擬has_active_schedule的邏輯
-    normalized_name = task_name.lstrip("\\")
-
-    matches = (
-        normalized_name == TASK_NAME
-        or normalized_name in scheduler.possible_task_names
-        or task_name == TASK_NAME
-        or task_name in scheduler.possible_task_names
-    )
+    # 使用has_active_schedule相同的匹配邏輯
+    matches = scheduler._match_task(task_name)
 
     status = "PASS" if matches == should_match else "FAIL"
     print(
@@ -63,14 +56,7 @@ csv_lines = [
 for line in csv_lines:
     if "," in line:
         current_task_name = line.split(",")[0].strip('"')
-        normalized_name = current_task_name.lstrip("\\")
-
-        matches = (
-            normalized_name == TASK_NAME
-            or normalized_name in scheduler.possible_task_names
-            or current_task_name == TASK_NAME
-            or current_task_name in scheduler.possible_task_names
-        )
+        matches = scheduler._match_task(current_task_name)
 
         print(f"  CSV: {line:45} -> 提取: '{current_task_name}' -> 匹配: {matches}")
 
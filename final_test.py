@@ -8,6 +8,7 @@ from unittest.mock import patch, MagicMock
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from src.scheduler import ShutdownScheduler
 from src.config import TASK_NAME
+from tests.support import fake_popen
 
 print("=== 最終測試：確認BUG修復 ===\n")
 
@@ -35,15 +36,19 @@ print(f"詳細資訊: {mock_detail_output}\n")
 
 # 測試1: has_active_schedule
 print("測試1: has_active_schedule")
-with patch("src.scheduler.subprocess.run") as mock_run:
-    mock_run.return_value = MagicMock(returncode=0, stdout=mock_task_list)
+with patch("src.scheduler.subprocess.Popen", side_effect=fake_popen), patch(
+    "src.scheduler.subprocess.run"
+) as mock_run:
+    mock_run.return_value = MagicMock(returncode=0, stdout=mock_task_list.encode())
     result = scheduler.has_active_schedule()
     print(f"  結果: {result}")
     print(f"  狀態: {'PASS - 找到排程' if result else 'FAIL - 找不到排程'}\n")
 
 # 測試2: get_schedule_info
 print("測試2: get_schedule_info")
-with patch("src.scheduler.subprocess.run") as mock_run:
+with patch("src.scheduler.subprocess.Popen", side_effect=fake_popen), patch(
+    "src.scheduler.subprocess.run"
+) as mock_run:
     mock_run.side_effect = [
         MagicMock(returncode=0, stdout=mock_task_list),
         MagicMock(returncode=0, stdout=mock_detail_output),
@@ -8,12 +8,13 @@ def main():
     """應用程式入口點"""
     # 集中設定日誌記錄，避免匯入模組時
     # 重新設定處理器或意外寫入檔案。
+    # delay=True 讓日誌檔在第一筆紀錄寫入時才開啟。
     log_path = Path.cwd() / LOG_FILE_NAME
     logging.basicConfig(
         level=logging.INFO,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         handlers=[
-            logging.FileHandler(log_path, encoding='utf-8'),
+            logging.FileHandler(log_path, encoding='utf-8', delay=True),
             logging.StreamHandler()
         ]
     )
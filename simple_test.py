@@ -8,6 +8,7 @@ from unittest.mock import patch, MagicMock
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from src.scheduler import ShutdownScheduler
 from src.config import TASK_NAME
+from tests.support import fake_popen
 
 print("=== 排程關機BUG分析 ===\n")
 
@@ -24,7 +25,9 @@ Last Result: 0
 Run As User: SYSTEM"""
 
 print("1. 模擬get_schedule_info的執行流程:")
-with patch("src.scheduler.subprocess.run") as mock_run:
+with patch("src.scheduler.subprocess.Popen", side_effect=fake_popen), patch(
+    "src.scheduler.subprocess.run"
+) as mock_run:
     mock_run.side_effect = [
         MagicMock(returncode=0, stdout=task_list_csv),  # 列出任務
         MagicMock(returncode=0, stdout=detail_output),  # 取得詳細資訊
@@ -52,8 +55,10 @@ print()
 
 # 測試has_active_schedule
 print("3. has_active_schedule 測試:")
-with patch("src.scheduler.subprocess.run") as mock_run:
-    mock_run.return_value = MagicMock(returncode=0, stdout=task_list_csv)
+with patch("src.scheduler.subprocess.Popen", side_effect=fake_popen), patch(
+    "src.scheduler.subprocess.run"
+) as mock_run:
+    mock_run.return_value = MagicMock(returncode=0, stdout=task_list_csv.encode())
     has_active = scheduler.has_active_schedule()
     print(f"   has_active_schedule(): {has_active}")
     print()
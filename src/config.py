@@ -2,6 +2,8 @@
 自動關機應用程式設定常數
 """
 
+from types import SimpleNamespace
+
 # 視窗尺寸
 WINDOW_WIDTH = 420
 WINDOW_HEIGHT = 750
@@ -30,8 +32,12 @@ CORNER_RADIUS = 16
 
 # 動畫時間設定
 COLON_BLINK_INTERVAL = 500  # milliseconds
+STATUS_FLASH_DURATION = 2500  # milliseconds
 SHUTDOWN_WARNING_TIME = 900  # seconds (15 minutes)
 
+# 排程查詢結果的快取時間（UI 連續查詢時避免重複呼叫 schtasks）
+SCHEDULE_CACHE_TTL = 2.0  # seconds
+
 # 檔案路徑
 CONFIG_FILE_NAME = ".auto_shutdown_config.json"
 LOG_FILE_NAME = "auto_shutdown.log"
@@ -41,8 +47,8 @@ TASK_NAME = "AutomaticShutdownScheduler"
 DAY_MAPPING = {1: "MON", 2: "TUE", 3: "WED", 4: "THU", 5: "FRI", 6: "SAT", 7: "SUN"}
 
 # 中文的星期名稱
-WEEKDAY_NAMES = ["一", "二", "三", "四", "五", "六", "日"]
-WEEKDAY_FULL_NAMES = [
+WEEKDAY_NAMES = ("一", "二", "三", "四", "五", "六", "日")
+WEEKDAY_FULL_NAMES = (
     "星期一",
     "星期二",
     "星期三",
@@ -50,24 +56,24 @@ WEEKDAY_FULL_NAMES = [
     "星期五",
     "星期六",
     "星期日",
-]
+)
 
 # 預設選中的星期（一和五）
 DEFAULT_SELECTED_DAYS = {0, 4}
 
-# 訊息字串
-MESSAGES = {
-    "validation_error": "請至少選擇一個星期",
-    "permission_error": "需要管理員權限才能建立排程任務。\n請以系統管理員身份運行程式。",
-    "success_scheduled": "已成功設定關機排程",
-    "success_canceled": "已取消關機排程",
-    "error_title": "錯誤",
-    "input_error": "輸入錯誤",
-    "success_title": "成功",
-    "schedule_status": "排程狀態",
-    "active_status": "已設定排程",
-    "inactive_status": "未設定排程",
-}
+# 訊息字串（以屬性存取，例如 MESSAGES.validation_error）
+MESSAGES = SimpleNamespace(
+    validation_error="請至少選擇一個星期",
+    permission_error="需要管理員權限才能建立排程任務。\n請以系統管理員身份運行程式。",
+    success_scheduled="已成功設定關機排程",
+    success_canceled="已取消關機排程",
+    error_title="錯誤",
+    input_error="輸入錯誤",
+    success_title="成功",
+    schedule_status="排程狀態",
+    active_status="已設定排程",
+    inactive_status="未設定排程",
+)
 
 # 說明提示
 HELP_TIPS = [
@@ -1,12 +1,30 @@
 """Windows專用排程模組，處理系統關機排程"""
 
+import copy
 import csv
 import json
 import locale
 import subprocess
-from datetime import datetime
+import threading
+from datetime import datetime, timedelta
+from operator import itemgetter
 from pathlib import Path
+from time import monotonic
 import logging
+import re
+
+try:
+    # pywin32（選用）：可直接呼叫 Task Scheduler COM API，不必啟動 schtasks.exe
+    import pythoncom
+    import win32com.client
+except ImportError:
+    pythoncom = win32com = None
+
+try:
+    # orjson（選用）：較快的 JSON 序列化，直接輸出 UTF-8 bytes
+    import orjson
+except ImportError:
+    orjson = None
 
 from .config import (
     CONFIG_FILE_NAME,
@@ -16,6 +34,8 @@ from .config import (
     CONFIG_ENCODING,
     SUBPROCESS_ENCODING,
     SHUTDOWN_WARNING_TIME,
+    SCHEDULE_CACHE_TTL,
+    WEEKDAY_NAMES,
 )
 
 logger = logging.getLogger(__name__)
@@ -23,28 +43,152 @@ logger = logging.getLogger(__name__)
 # 在多處使用的通用schtasks子命令
 SCHTASKS_QUERY = "/query"
 
+# 要檢查的任務名稱（包括舊版本使用的名稱），依查詢優先順序排列
+POSSIBLE_TASK_NAMES = (
+    TASK_NAME,
+    "AutomaticS",  # 可能的簡短版本
+    "AutoShutdown",  # 舊版本使用的名稱
+)
+# 預先建立小寫的雜湊集合，讓每列任務的名稱比對為 O(1)
+# （Windows 任務名稱不分大小寫）
+_TASK_NAME_SET = frozenset(name.lower() for name in POSSIBLE_TASK_NAMES)
+# 同時找到多個任務時，依上列順序決定優先使用哪一個
+_TASK_NAME_RANK = {name.lower(): rank for rank, name in enumerate(POSSIBLE_TASK_NAMES)}
+# 編碼後的小寫任務名稱，用於在未解碼的 schtasks 輸出中快速搜尋
+_TASK_NAME_BYTES = tuple(
+    name.lower().encode(SUBPROCESS_ENCODING) for name in POSSIBLE_TASK_NAMES
+)
+
+# Task Scheduler COM API 常數
+_TASK_TRIGGER_WEEKLY = 3
+_TASK_ACTION_EXEC = 0
+_TASK_CREATE_OR_UPDATE = 6
+_TASK_LOGON_SERVICE_ACCOUNT = 5
+_TASK_RUNLEVEL_HIGHEST = 1
+_TASK_ENUM_HIDDEN = 1
+# WeeklyTrigger.DaysOfWeek 位元，以 DAY_MAPPING 的 1-7 為索引（7=週日=1、週一=2 ... 週六=64）
+_DAY_BIT = (0, 2, 4, 8, 16, 32, 64, 1)
+# IRegisteredTask.State 對應的顯示文字
+_TASK_STATES = {1: "已停用", 2: "已排入佇列", 3: "就緒", 4: "執行中"}
+
+
+# schtasks 詳細資訊中要顯示的欄位，以及各語系下可能的鍵名（依優先順序）
+_DETAIL_FIELDS = {
+    "name": ("工作名稱", "TaskName", "名稱"),
+    "next_run": ("下次執行時間", "Next Run Time", "下次運行時間"),
+    "status": ("狀態", "Status"),
+    "schedule_type": ("排程類型", "Schedule Type", "類型"),
+    "last_run": ("上次執行時間", "Last Run Time", "上次運行時間"),
+    "last_result": ("上次執行的結果", "Last Result", "最後結果"),
+    "account": ("執行身分", "Run As User", "運行身分"),
+}
+_DETAIL_KEY_TO_FIELD = {
+    key: field for field, keys in _DETAIL_FIELDS.items() for key in keys
+}
+# 各欄位的顯示標籤（依顯示順序）
+_DETAIL_LABELS = {
+    "name": "任務名稱",
+    "next_run": "下次執行時間",
+    "status": "狀態",
+    "schedule_type": "排程類型",
+    "last_run": "上次執行時間",
+    "last_result": "上次執行結果",
+    "account": "執行身分",
+}
+# 一定顯示的欄位（缺少時顯示「未知」），其餘欄位僅在輸出中有提供時顯示
+_BASIC_FIELDS = ("name", "next_run", "status")
+
+
+# 任務下次執行時間中的時與分，例如「2026/1/14 23:15:00」或「1/14/2026 11:15:00 PM」
+_CLOCK_TIME = re.compile(r"(\d{1,2}):(\d{2})")
+
+
+# 子行程共用參數：輸出解碼方式，以及讀取 stdout / stderr 時的串流設定
+_SP_TEXT = {"text": True, "encoding": SUBPROCESS_ENCODING}
+_SP_CAPTURE = {"stdout": subprocess.PIPE, "stderr": subprocess.DEVNULL}
+_SP_SILENT = {"stdout": subprocess.DEVNULL, "stderr": subprocess.PIPE}
+_SP_DISCARD = {"stdout": subprocess.DEVNULL, "stderr": subprocess.DEVNULL}
+
+
+def _run_schtasks(args, capture=False, **kwargs):
+    """執行 schtasks 子命令
+
+    capture=True 時只讀取 stdout（供解析查詢結果），丟棄 stderr；
+    capture=False 時丟棄 stdout，只保留 stderr 供失敗時記錄錯誤。
+    """
+    streams = _SP_CAPTURE if capture else _SP_SILENT
+    return subprocess.run(["schtasks", *args], **streams, **kwargs)
+
+
+def _weekdays_arg(weekdays):
+    """驗證星期並轉換為 schtasks /d 參數（以逗號分隔，例如 MON,WED,FRI）"""
+    if not weekdays:
+        raise ValueError("無效的星期: 至少需要選擇一天")
+    try:
+        codes = itemgetter(*weekdays)(DAY_MAPPING)
+    except KeyError as e:
+        raise ValueError(f"無效的星期: {e.args[0]} (必須是 1-7)") from None
+    # 只有一個星期時 itemgetter 回傳單一字串而非 tuple
+    return codes if isinstance(codes, str) else ",".join(codes)
+
+
+def _dumps_config(config):
+    """將設定序列化為 UTF-8 bytes（有 orjson 時使用 orjson）"""
+    if orjson is not None:
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2)
+    return json.dumps(config, ensure_ascii=False, indent=2).encode(CONFIG_ENCODING)
+
+
+def _loads_config(data):
+    """從 bytes 解析設定（有 orjson 時使用 orjson）"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode(CONFIG_ENCODING))
+
+
+class ScheduleError(RuntimeError):
+    """排程操作失敗；user_message 為建立例外時就格式化好、可直接顯示給使用者的訊息"""
+
+    def __init__(self, message, user_message):
+        super().__init__(message)
+        self.user_message = user_message
+
 
 class ShutdownScheduler:
     """Windows排程器類別，用於管理系統關機任務"""
 
+    # 以下常數由所有實例共用，不必在每次建立實例時重新產生
+    task_name = TASK_NAME
+    possible_task_names = POSSIBLE_TASK_NAMES
+    # 使用配置中的編碼設定
+    encoding = SUBPROCESS_ENCODING
+
     def __init__(self):
         self.config_path = Path.home() / CONFIG_FILE_NAME
-        self.task_name = TASK_NAME
-        # 要檢查的任務名稱列表（包括舊版本使用的名稱）
-        self.possible_task_names = [
-            TASK_NAME,
-            "AutomaticS",  # 可能的簡短版本
-            "AutoShutdown",  # 舊版本使用的名稱
-        ]
-        # 使用配置中的編碼設定
-        self.encoding = SUBPROCESS_ENCODING
+        # 已連線的 Task Scheduler COM 服務（各執行緒首次使用時建立）
+        self._com = threading.local()
+        # 查詢結果快取（任務列表），建立/移除排程時清除
+        self._cache = {}
+        self._cache_ts = {}
+        # 上次讀取的設定，以 (檔案修改時間, 檔案大小) 判斷是否仍有效
+        self._config_stamp = None
+        self._config = None
 
     def create_schedule(self, weekdays, time, is_repeat):
         """建立系統關機排程"""
-        # 驗證輸入
-        for day in weekdays:
-            if day not in DAY_MAPPING:
-                raise ValueError(f"無效的星期: {day} (必須是 1-7)")
+        existing = self.load_config()
+        if (
+            self._schedule_equals(existing, weekdays, time)
+            and self._seconds_until(time) > SHUTDOWN_WARNING_TIME
+            and self._has_current_task(time)
+        ):
+            # 排程內容未變更且任務仍存在，不需重新建立 Windows 任務
+            # （關機時間在警告時間內時仍須走完整流程以立即執行關機）
+            if existing.get("is_repeat") != is_repeat:
+                existing["is_repeat"] = is_repeat
+                self._save_config(existing)
+            logger.info("Schedule unchanged, skipping task re-creation")
+            return
 
         try:
             self._create_windows_task(weekdays, time)
@@ -62,18 +206,41 @@ class ShutdownScheduler:
         except Exception as e:
             logger.error(f"Failed to create schedule: {str(e)}")
             raise
+        finally:
+            self._invalidate_cache()
+
+    @staticmethod
+    def config_weekdays(config):
+        """取得設定檔中選擇的星期（1-7 排序後的列表）
+
+        舊版設定檔以 7 個布林值依序表示週一到週日，新版直接儲存星期數字；
+        格式無法解析時拋出 TypeError 或 ValueError。
+        """
+        saved = list(config.get("weekdays") or ())
+        # 同一份設定檔中的星期格式一致，只需檢查第一個元素
+        if saved and isinstance(saved[0], bool):
+            return [i + 1 for i, enabled in enumerate(saved) if enabled]
+        return sorted({int(day) for day in saved})
+
+    @classmethod
+    def _schedule_equals(cls, config, weekdays, time):
+        """檢查已儲存的設定是否與要求的星期及時間相同"""
+        if not config:
+            return False
+        try:
+            return config.get("time") == time and cls.config_weekdays(
+                config
+            ) == sorted(weekdays)
+        except (TypeError, ValueError):
+            return False
 
     def remove_schedule(self):
         """移除現有關機排程"""
         try:
             # 先嘗試中止正在執行中的關機命令
             try:
-                abort_result = subprocess.run(
-                    ["shutdown", "/a"],
-                    capture_output=True,
-                    text=True,
-                    encoding=SUBPROCESS_ENCODING,
-                )
+                # 只需要回傳碼，輸出直接丟棄
+                abort_result = subprocess.run(["shutdown", "/a"], **_SP_DISCARD)
                 if abort_result.returncode == 0:
                     logger.info("Successfully aborted active shutdown countdown")
                 else:
@@ -83,11 +250,15 @@ class ShutdownScheduler:
                 logger.debug(f"Failed to abort shutdown (may not be running): {str(e)}")
             
             # 刪除排程任務
-            subprocess.run(
-                ["schtasks", "/delete", "/tn", self.task_name, "/f"],
-                capture_output=True,
-                check=True,
-            )
+            if not self._delete_task_com():
+                result = _run_schtasks(
+                    ["/delete", "/tn", self.task_name, "/f"], **_SP_TEXT
+                )
+                if result.returncode != 0:
+                    raise ScheduleError(
+                        f"Task deletion failed: {result.stderr}",
+                        f"移除排程任務失敗：{(result.stderr or '').strip()}",
+                    )
 
             if self.config_path.exists():
                 try:
@@ -102,9 +273,23 @@ class ShutdownScheduler:
         except Exception as e:
             logger.error(f"Failed to remove schedule: {str(e)}")
             raise
-
-    def get_schedule_info(self):
-        """取得目前排程資訊"""
+        finally:
+            self._invalidate_cache()
+
+    def get_schedule_info(self, verify=False):
+        """取得目前排程資訊
+
+        預設直接由已儲存的設定檔產生資訊，不必啟動 schtasks；
+        設定檔不存在、格式不符或 verify=True 時才向 Windows 任務排程器查詢。
+        """
+        if not verify:
+            config = self.load_config()
+            if config:
+                info = self._format_config_info(config)
+                if info:
+                    return info
+
+        # 任務資訊直接由已快取的任務列表產生，不另外快取
         try:
             return self._get_windows_task_info()
         except Exception as e:
@@ -112,12 +297,22 @@ class ShutdownScheduler:
             return "無法獲取排程資訊"
 
     def load_config(self):
-        """載入已儲存的設定"""
+        """載入已儲存的設定
+
+        設定檔自上次讀取後未變更時直接沿用已解析的結果，不重新讀檔解析。
+        """
         try:
-            if self.config_path.exists():
-                with open(self.config_path, "r", encoding=CONFIG_ENCODING) as f:
-                    return json.load(f)
-            return None
+            try:
+                st = self.config_path.stat()
+            except FileNotFoundError:
+                return None
+            stamp = (st.st_mtime_ns, st.st_size)
+            if stamp != self._config_stamp:
+                with open(self.config_path, "rb") as f:
+                    self._config = _loads_config(f.read())
+                self._config_stamp = stamp
+            # 回傳深層副本，避免呼叫端修改到快取內容（包括 weekdays 等列表）
+            return copy.deepcopy(self._config)
         except Exception as e:
             logger.error(f"Failed to load config: {str(e)}")
             return None
@@ -125,32 +320,285 @@ class ShutdownScheduler:
     def _save_config(self, config):
         """將設定儲存到檔案"""
         try:
-            with open(self.config_path, "w", encoding=CONFIG_ENCODING) as f:
-                json.dump(config, f, ensure_ascii=False, indent=2)
+            with open(self.config_path, "wb") as f:
+                f.write(_dumps_config(config))
         except Exception as e:
             logger.error(f"Failed to save config: {str(e)}")
             raise
+        finally:
+            # 檔案系統的 mtime 精度可能不足以區分前後兩次寫入，下次載入時強制重新讀取
+            self._config_stamp = None
+
+    def _cache_get(self, key):
+        """取得尚未過期的快取結果，過期或不存在時回傳 None"""
+        ts = self._cache_ts.get(key)
+        if ts is not None and monotonic() - ts < SCHEDULE_CACHE_TTL:
+            return self._cache[key]
+        return None
+
+    def _cache_put(self, key, value):
+        """儲存查詢結果並記錄時間戳記"""
+        self._cache[key] = value
+        self._cache_ts[key] = monotonic()
+
+    def _invalidate_cache(self):
+        """清除所有查詢快取（排程狀態已變更）"""
+        self._cache.clear()
+        self._cache_ts.clear()
+
+    @staticmethod
+    def _task_base_name(name):
+        """取出任務名稱去除 \\ 或 / 資料夾路徑前綴後的小寫名稱"""
+        return name.replace("/", "\\").rpartition("\\")[2].lower()
+
+    def _match_task(self, name):
+        """檢查任務名稱是否為本程式的任務（忽略 \\ 或 / 資料夾路徑前綴與大小寫）"""
+        return self._task_base_name(name) in _TASK_NAME_SET
+
+    def _contains_task_name(self, raw):
+        """檢查未解碼的輸出中是否出現任何可能的任務名稱（不分大小寫）"""
+        raw = raw.lower()
+        return any(name in raw for name in _TASK_NAME_BYTES)
+
+    def _iter_listed_tasks(self, lines):
+        """從未解碼的 schtasks /v CSV 輸出行中依序產生符合任務的資訊字典
+
+        lines 可為任何產生 bytes 行的可迭代物件（例如子行程的 stdout），
+        逐行處理而不需先讀入整份輸出。第一行為欄位標題，依 _DETAIL_FIELDS
+        轉換為欄位名稱；其餘各行先以 bytes 搜尋排除不含任務名稱的行，
+        只解碼可能符合的行，再交由 csv.reader 與 _match_task 做精確比對。
+        """
+        lines = iter(lines)
+        header = next((line for line in lines if line.strip()), b"")
+        header = header.decode(SUBPROCESS_ENCODING, errors="replace")
+        fields = [
+            _DETAIL_KEY_TO_FIELD.get(key.strip())
+            for key in next(csv.reader([header]), [])
+        ]
+        # 標題中沒有任務名稱欄位時，視為非詳細格式（第一欄即為任務名稱）
+        name_index = fields.index("name") if "name" in fields else 0
+
+        candidate_lines = (
+            line.decode(SUBPROCESS_ENCODING, errors="replace")
+            for line in lines
+            if self._contains_task_name(line)
+        )
+        # 使用 csv.reader 正確處理引號與欄位內的逗號
+        for row in csv.reader(candidate_lines):
+            if len(row) <= name_index or not self._match_task(row[name_index]):
+                continue
+            task_info = {"name": row[name_index]}
+            for field, value in zip(fields, row):
+                if field:
+                    task_info.setdefault(field, value.strip())
+            yield task_info
+
+    def _query_tasks_cached(self):
+        """列出系統中符合的任務及其詳細資訊，短時間內重複呼叫時使用快取
+
+        以單次 schtasks /query /fo csv /v 取得所有欄位，不必再逐一以 /tn 查詢。
+        結果依 POSSIBLE_TASK_NAMES 的優先順序排列；查詢失敗時回傳 None 且不寫入快取。
+        """
+        key = ("task_list",)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
+        tasks = self._list_tasks_com()
+        if tasks is None:
+            tasks = self._list_tasks_schtasks()
+            if tasks is None:
+                return None
+
+        tasks = tuple(
+            sorted(
+                tasks,
+                key=lambda info: _TASK_NAME_RANK[self._task_base_name(info["name"])],
+            )
+        )
+        self._cache_put(key, tasks)
+        return tasks
+
+    def _list_tasks_schtasks(self):
+        """以串流方式讀取 schtasks 詳細列表，查詢失敗時回傳 None
+
+        找到優先順序最高的任務名稱後即結束 schtasks，不必等它列完
+        其餘（通常數量龐大的）系統任務資料夾。
+        """
+        try:
+            proc = subprocess.Popen(
+                ["schtasks", SCHTASKS_QUERY, "/fo", "csv", "/v"], **_SP_CAPTURE
+            )
+        except OSError as e:
+            logger.error(f"Failed to run schtasks: {str(e)}")
+            return None
+
+        tasks = []
+        with proc:
+            for task_info in self._iter_listed_tasks(proc.stdout):
+                tasks.append(task_info)
+                if _TASK_NAME_RANK[self._task_base_name(task_info["name"])] == 0:
+                    proc.terminate()
+                    return tasks
+        if proc.returncode != 0:
+            return None
+        return tasks
+
+    def _ts_service(self):
+        """取得已連線的 Task Scheduler COM 服務，pywin32 不可用時回傳 None"""
+        if win32com is None:
+            return None
+        service = getattr(self._com, "service", None)
+        if service is None:
+            # COM 物件只能在建立它的執行緒使用，因此每個執行緒各自初始化並連線
+            if pythoncom is not None:
+                pythoncom.CoInitialize()
+            try:
+                service = win32com.client.Dispatch("Schedule.Service")
+                service.Connect()
+            except Exception:
+                if pythoncom is not None:
+                    pythoncom.CoUninitialize()
+                raise
+            self._com.service = service
+        return service
+
+    def release_com(self):
+        """釋放目前執行緒的 Task Scheduler 服務，並與 _ts_service 的 CoInitialize 配對"""
+        if getattr(self._com, "service", None) is None:
+            return
+        del self._com.service
+        if pythoncom is not None:
+            pythoncom.CoUninitialize()
+
+    def _list_tasks_com(self):
+        """透過 COM API 列出所有資料夾中符合的任務，無法使用時回傳 None"""
+        try:
+            service = self._ts_service()
+            if service is None:
+                return None
+            tasks = []
+            folders = [service.GetFolder("\\")]
+            while folders:
+                folder = folders.pop()
+                for task in folder.GetTasks(_TASK_ENUM_HIDDEN):
+                    if self._match_task(task.Name):
+                        tasks.append(self._com_task_info(task))
+                folders.extend(folder.GetFolders(0))
+            return tasks
+        except Exception as e:
+            logger.warning(f"Task Scheduler API query failed, using schtasks: {str(e)}")
+            return None
+
+    @staticmethod
+    def _com_task_info(task):
+        """將 IRegisteredTask 轉換為與 schtasks 解析結果相同的資訊字典"""
+        return {
+            "name": task.Path,
+            "next_run": f"{task.NextRunTime:%Y/%m/%d %H:%M:%S}",
+            "status": _TASK_STATES.get(task.State, "未知"),
+            "last_run": f"{task.LastRunTime:%Y/%m/%d %H:%M:%S}",
+            "last_result": str(task.LastTaskResult),
+            "account": task.Definition.Principal.UserId,
+        }
+
+    def _register_task_com(self, weekdays, hour, minute):
+        """透過 COM API 建立或覆寫每週任務，無法使用時回傳 False"""
+        try:
+            service = self._ts_service()
+            if service is None:
+                return False
+            definition = service.NewTask(0)
+
+            trigger = definition.Triggers.Create(_TASK_TRIGGER_WEEKLY)
+            trigger.StartBoundary = datetime.now().strftime(
+                f"%Y-%m-%dT{hour:02d}:{minute:02d}:00"
+            )
+            # weekdays 已由 _weekdays_arg 驗證為 1-7
+            mask = 0
+            for day in weekdays:
+                mask |= _DAY_BIT[day]
+            trigger.DaysOfWeek = mask
+            trigger.WeeksInterval = 1
+
+            action = definition.Actions.Create(_TASK_ACTION_EXEC)
+            action.Path, _, action.Arguments = SHUTDOWN_COMMAND.partition(" ")
+            definition.Principal.RunLevel = _TASK_RUNLEVEL_HIGHEST
+
+            service.GetFolder("\\").RegisterTaskDefinition(
+                self.task_name,
+                definition,
+                _TASK_CREATE_OR_UPDATE,
+                "SYSTEM",
+                None,
+                _TASK_LOGON_SERVICE_ACCOUNT,
+            )
+            return True
+        except Exception as e:
+            logger.warning(f"Task Scheduler API create failed, using schtasks: {str(e)}")
+            return False
+
+    def _delete_task_com(self):
+        """透過 COM API 刪除任務，無法使用或刪除失敗時回傳 False"""
+        try:
+            service = self._ts_service()
+            if service is None:
+                return False
+            service.GetFolder("\\").DeleteTask(self.task_name, 0)
+            return True
+        except Exception as e:
+            logger.debug(f"Task Scheduler API delete failed, using schtasks: {str(e)}")
+            return False
+
+    def _has_current_task(self, time):
+        """檢查是否已有目前名稱的任務，且下次執行時間符合指定的關機時間
+
+        只找到舊版名稱的任務，或下次執行時間無法辨識時都視為不符，需重新建立任務。
+        """
+        tasks = self._query_tasks_cached()
+        if not tasks or self._task_base_name(tasks[0]["name"]) != TASK_NAME.lower():
+            return False
+        match = _CLOCK_TIME.search(tasks[0].get("next_run", ""))
+        if not match:
+            return False
+        trigger_hour, trigger_minute = self._trigger_time(time)
+        # 部分語系以 12 小時制顯示下次執行時間，因此時只比較 12 小時制的值
+        return (
+            int(match.group(2)) == trigger_minute
+            and int(match.group(1)) % 12 == trigger_hour % 12
+        )
+
+    @staticmethod
+    def _trigger_time(time):
+        """計算任務實際觸發的時與分（比關機時間提前 SHUTDOWN_WARNING_TIME 秒）"""
+        hour, minute = map(int, time.split(":"))
+        trigger = datetime(2000, 1, 1, hour, minute) - timedelta(
+            seconds=SHUTDOWN_WARNING_TIME
+        )
+        return trigger.hour, trigger.minute
+
+    @staticmethod
+    def _seconds_until(time):
+        """計算距離下一次指定時間（HH:MM）的秒數，已過則以明天計算"""
+        hour, minute = map(int, time.split(":"))
+        now = datetime.now()
+        target = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        if target < now:
+            # 目標時間已經過去，嘗試明天
+            target += timedelta(days=1)
+        return (target - now).total_seconds()
 
     def _create_windows_task(self, weekdays, time):
         """建立Windows排程任務"""
         hour, minute = map(int, time.split(":"))
-        weekdays_str = " ".join(DAY_MAPPING[day] for day in weekdays)
+        # 同時驗證星期（無效時拋出 ValueError），須在任何系統操作之前
+        weekdays_str = _weekdays_arg(weekdays)
 
         # 計算實際執行時間（提前15分鐘，因為 shutdown /t 900 會等15分鐘後關機）
-        from datetime import datetime as dt, timedelta
-        now = dt.now()
-        target_time = dt(2000, 1, 1, hour, minute)
-        actual_time = target_time - timedelta(seconds=SHUTDOWN_WARNING_TIME)
-        actual_hour = actual_time.hour
-        actual_minute = actual_time.minute
-        
+        actual_hour, actual_minute = self._trigger_time(time)
+
         # 檢查排程時間是否已經過去（使用者設定在 15 分鐘內關機）
-        today_target_time = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
-        if today_target_time < now:
-            # 目標時間已經過去，嘗試明天
-            today_target_time += timedelta(days=1)
-        
-        time_until_shutdown = (today_target_time - now).total_seconds()
+        time_until_shutdown = self._seconds_until(time)
         
         # 如果關機時間在 15 分鐘內，立即執行
         if time_until_shutdown <= SHUTDOWN_WARNING_TIME:
@@ -161,38 +609,30 @@ class ShutdownScheduler:
             
             try:
                 result = subprocess.run(
-                    immediate_command,
-                    shell=True,
-                    capture_output=True,
-                    text=True,
-                    encoding=SUBPROCESS_ENCODING,
+                    immediate_command, shell=True, capture_output=True, **_SP_TEXT
                 )
                 if result.returncode == 0:
                     logger.info(f"Immediate shutdown scheduled for {remaining_seconds}s from now")
                     # 仍然建立定期排程以供未來使用
                     # 繼續執行下面的排程建立邏輯
                 else:
-                    raise RuntimeError(f"Failed to execute immediate shutdown: {result.stderr}")
+                    raise ScheduleError(
+                        f"Failed to execute immediate shutdown: {result.stderr}",
+                        "無法立即執行關機命令",
+                    )
             except Exception as e:
                 logger.error(f"Failed to execute immediate shutdown: {str(e)}")
                 raise
         
         logger.info(f"User wants shutdown at {hour:02d}:{minute:02d}, scheduling task at {actual_hour:02d}:{actual_minute:02d}")
 
-        # 刪除任何現有的舊任務
-        try:
-            subprocess.run(
-                ["schtasks", "/delete", "/tn", self.task_name, "/f"],
-                capture_output=True,
-                text=True,
-                encoding=SUBPROCESS_ENCODING,
-            )
-        except Exception as e:
-            logger.warning(f"Failed to delete existing task, continuing: {str(e)}")
+        # 優先透過 COM API 在行程內建立任務，無法使用時才改用 schtasks
+        if self._register_task_com(weekdays, actual_hour, actual_minute):
+            logger.info("Windows task created via Task Scheduler API")
+            return None
 
-        # 使用完整命令參數建立新任務
+        # 使用完整命令參數建立新任務（/f 會直接覆寫同名的既有任務，不需先刪除）
         cmd = [
-            "schtasks",
             "/create",
             "/tn",
             self.task_name,
@@ -212,27 +652,25 @@ class ShutdownScheduler:
         ]
 
         try:
-            result = subprocess.run(
-                cmd, capture_output=True, text=True, encoding=SUBPROCESS_ENCODING
-            )
+            result = _run_schtasks(cmd, **_SP_TEXT)
 
-            if result.returncode == 0:
-                logger.info("Windows task created successfully")
-                # 驗證任務是否實際建立
-                verify_result = subprocess.run(
-                    ["schtasks", SCHTASKS_QUERY, "/tn", self.task_name],
-                    capture_output=True,
-                    text=True,
-                    encoding=SUBPROCESS_ENCODING,
+            if result.returncode != 0:
+                # 既有任務的屬性可能與新設定衝突，此時才刪除舊任務後重試一次
+                logger.warning(
+                    f"Task creation failed, retrying after delete: {result.stderr}"
                 )
+                _run_schtasks(["/delete", "/tn", self.task_name, "/f"], **_SP_TEXT)
+                result = _run_schtasks(cmd, **_SP_TEXT)
 
-                if verify_result.returncode == 0:
-                    logger.info("Task verified successfully")
-                    return result
-                else:
-                    raise RuntimeError("Task verification failed after creation")
-            else:
-                raise RuntimeError("Task creation failed: " + result.stderr)
+            # schtasks /create 只有在任務成功註冊時才回傳 0，不需再另外查詢驗證；
+            # 需要任務詳細資訊時由 get_schedule_info 查詢
+            if result.returncode == 0:
+                logger.info("Windows task created successfully")
+                return result
+            raise ScheduleError(
+                f"Task creation failed: {result.stderr}",
+                f"建立排程任務失敗：{(result.stderr or '').strip()}",
+            )
 
         except Exception as e:
             logger.error(f"Failed to create Windows task: {str(e)}")
@@ -244,76 +682,12 @@ class ShutdownScheduler:
         error_messages = []
 
         try:
-            # 首先列出所有任務
-            list_result = subprocess.run(
-                ["schtasks", SCHTASKS_QUERY, "/fo", "csv", "/nh"],
-                capture_output=True,
-                text=True,
-                encoding=SUBPROCESS_ENCODING,
-            )
-
-            if list_result.returncode == 0:
-                tasks = list_result.stdout.splitlines()
-                for task in tasks:
-                    # CSV格式，第一個欄位是任務名稱
-                    if "," in task:
-                        current_task_name = task.split(",")[0].strip('"')
-                        # 移除可能的路徑前綴（例如 \AutomaticShutdownScheduler 或 TaskFolder\AutomaticShutdownScheduler）
-                        # 使用 partition 來處理各種路徑格式
-                        normalized_name = (
-                            current_task_name.split("\\")[-1]
-                            if "\\" in current_task_name
-                            else current_task_name
-                        )
-
-                        # 檢查是否匹配（包含完整名稱和簡短版本）
-                        is_match = (
-                            normalized_name == TASK_NAME
-                            or normalized_name in self.possible_task_names
-                            or current_task_name == TASK_NAME
-                            or current_task_name in self.possible_task_names
-                        )
-
-                        # 額外檢查：如果任務名稱包含我們的任務名稱作為後綴
-                        if not is_match and TASK_NAME in current_task_name:
-                            # 檢查最後一部分是否匹配
-                            last_part = current_task_name.split("\\")[-1]
-                            if (
-                                last_part == TASK_NAME
-                                or last_part in self.possible_task_names
-                            ):
-                                is_match = True
-
-                        if is_match:
-                            logger.info(f"Found task: {current_task_name}")
-                            # 取得詳細資訊
-                            detail_result = subprocess.run(
-                                [
-                                    "schtasks",
-                                    SCHTASKS_QUERY,
-                                    "/tn",
-                                    current_task_name,
-                                    "/v",
-                                    "/fo",
-                                    "list",
-                                ],
-                                capture_output=True,
-                                text=True,
-                                encoding=SUBPROCESS_ENCODING,
-                            )
-
-                            if detail_result.returncode == 0:
-                                # 解析詳細資訊
-                                current_info = {}
-                                for line in detail_result.stdout.split("\n"):
-                                    if ": " in line:
-                                        key, value = line.split(": ", 1)
-                                        current_info[key.strip()] = value.strip()
-
-                                if current_info:
-                                    task_info = current_info
-                                    self.task_name = current_task_name
-                                    break
+            # 單次詳細列表查詢即包含所需欄位（含子資料夾中的任務）
+            tasks = self._query_tasks_cached()
+            if tasks:
+                task_info = tasks[0]
+                logger.info(f"Found task: {task_info['name']}")
+                self.task_name = task_info["name"]
 
         except Exception as e:
             error_messages.append(f"檢查任務時發生錯誤: {str(e)}")
@@ -324,23 +698,6 @@ class ShutdownScheduler:
             logger.info(f"Found task info: {task_info}")
             return self._format_task_info(task_info)
 
-        # 如果找不到任務，嘗試使用 wmic
-        try:
-            wmic_result = subprocess.run(
-                ["wmic", "job", "list", "full"],
-                capture_output=True,
-                text=True,
-                encoding=SUBPROCESS_ENCODING,
-            )
-
-            if wmic_result.returncode == 0:
-                if "AutomaticShutdownScheduler" in wmic_result.stdout:
-                    return (
-                        "找到排程任務，但無法取得詳細資訊。建議使用系統管理員權限執行。"
-                    )
-        except Exception:
-            pass
-
         # 如果有錯誤訊息
         if error_messages:
             logger.warning("Errors while checking tasks: " + "\n".join(error_messages))
@@ -351,25 +708,35 @@ class ShutdownScheduler:
 
     def _format_task_info(self, task_info):
         """格式化任務資訊以供顯示"""
-        # 嘗試不同的可能的鍵名（中文系統可能有不同翻譯）
-        name_keys = ["工作名稱", "TaskName", "名稱"]
-        next_run_keys = ["下次執行時間", "Next Run Time", "下次運行時間"]
-        schedule_type_keys = ["排程類型", "Schedule Type", "類型"]
-        last_run_keys = ["上次執行時間", "Last Run Time", "上次運行時間"]
-        last_result_keys = ["上次執行的結果", "Last Result", "最後結果"]
-        account_keys = ["執行身分", "Run As User", "運行身分"]
-
-        def get_first_match(keys):
-            return next((task_info.get(k) for k in keys if k in task_info), "未知")
-
-        return f"""排程狀態：
-任務名稱: {get_first_match(name_keys)}
-下次執行時間: {get_first_match(next_run_keys)}
-排程類型: {get_first_match(schedule_type_keys)}
-上次執行時間: {get_first_match(last_run_keys)}
-上次執行結果: {get_first_match(last_result_keys)}
-執行身分: {get_first_match(account_keys)}
-"""
+        lines = ["排程狀態："]
+        for field, label in _DETAIL_LABELS.items():
+            if field in _BASIC_FIELDS or field in task_info:
+                lines.append(f"{label}: {task_info.get(field, '未知')}")
+        return "\n".join(lines) + "\n"
+
+    def _format_config_info(self, config):
+        """以設定檔內容格式化排程資訊，格式不符時回傳 None"""
+        try:
+            hour, minute = map(int, config["time"].split(":"))
+            days = self.config_weekdays(config)
+            if not days or any(day not in DAY_MAPPING for day in days):
+                return None
+        except Exception:
+            logger.debug("Config does not contain a usable schedule, querying schtasks")
+            return None
+
+        day_names = "、".join([WEEKDAY_NAMES[day - 1] for day in days])
+
+        lines = [
+            "排程狀態：",
+            f"任務名稱: {self.task_name}",
+            f"關機時間: {hour:02d}:{minute:02d}",
+            f"執行星期: {day_names}",
+            f"重複執行: {'是' if config.get('is_repeat', True) else '否'}",
+        ]
+        if config.get("created_at"):
+            lines.append(f"設定時間: {config['created_at']}")
+        return "\n".join(lines) + "\n"
 
     def has_active_schedule(self):
         """檢查是否有執行中的排程"""
@@ -378,49 +745,11 @@ class ShutdownScheduler:
             has_task = False
             has_config = self.config_path.exists()
 
-            # 檢查Windows任務排程器
-            list_result = subprocess.run(
-                ["schtasks", SCHTASKS_QUERY, "/fo", "csv", "/nh"],
-                capture_output=True,
-                text=True,
-                encoding=SUBPROCESS_ENCODING,
-            )
-
-            if list_result.returncode == 0:
-                tasks = list_result.stdout.splitlines()
-                for task in tasks:
-                    # CSV格式，第一個欄位是任務名稱
-                    if "," in task:
-                        current_task_name = task.split(",")[0].strip('"')
-                        # 移除可能的路徑前綴（例如 \AutomaticShutdownScheduler 或 TaskFolder\AutomaticShutdownScheduler）
-                        normalized_name = (
-                            current_task_name.split("\\")[-1]
-                            if "\\" in current_task_name
-                            else current_task_name
-                        )
-
-                        # 檢查是否匹配（包含完整名稱和簡短版本）
-                        is_match = (
-                            normalized_name == TASK_NAME
-                            or normalized_name in self.possible_task_names
-                            or current_task_name == TASK_NAME
-                            or current_task_name in self.possible_task_names
-                        )
-
-                        # 額外檢查：如果任務名稱包含我們的任務名稱作為後綴
-                        if not is_match and TASK_NAME in current_task_name:
-                            # 檢查最後一部分是否匹配
-                            last_part = current_task_name.split("\\")[-1]
-                            if (
-                                last_part == TASK_NAME
-                                or last_part in self.possible_task_names
-                            ):
-                                is_match = True
-
-                        if is_match:
-                            logger.info(f"Found active schedule: {current_task_name}")
-                            has_task = True
-                            break
+            # 檢查Windows任務排程器（與 get_schedule_info 共用快取的任務列表）
+            tasks = self._query_tasks_cached()
+            if tasks:
+                logger.info(f"Found active schedule: {tasks[0]['name']}")
+                has_task = True
 
             # 只要Windows任務排程器中存在任務，就認為有活躍排程
             # 配置檔案遺失不應影響排程狀態的判定
@@ -1,8 +1,9 @@
 """Modern main window for the auto shutdown application"""
 
+import queue
+import re
+import threading
 import tkinter as tk
-from tkinter import messagebox
-from datetime import datetime
 from ..scheduler import ShutdownScheduler
 from .modern_theme import COLORS, FONTS, configure_styles
 from .modern_widgets import (
@@ -30,6 +31,7 @@ from ..config import (
     PADDING_WIDGET,
     CORNER_RADIUS,
     COLON_BLINK_INTERVAL,
+    STATUS_FLASH_DURATION,
     WEEKDAY_NAMES,
     WEEKDAY_FULL_NAMES,
     DEFAULT_SELECTED_DAYS,
@@ -42,6 +44,57 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Picker values are fixed, so build them once instead of on every popup
+_HOURS_24 = tuple(f"{i:02d}" for i in range(24))
+_HOURS_12 = tuple(f"{i:02d}" for i in range(1, 13))
+_MINUTES = tuple(f"{i:02d}" for i in range(60))
+# Blinking colon colors, indexed by colon_visible (hidden blends into the background)
+_COLON_COLORS = (COLORS["bg_light"], COLORS["text_main"])
+# How often the Tk thread checks for a finished background task, in milliseconds
+_WORKER_POLL_INTERVAL = 50
+# Next run time in task scheduler info, e.g. "2026/1/14 23:30:00" or "2026-01-14 23:30:00"
+# The label is located with str.find and the pattern only matches right after it
+_NEXT_RUN_LABELS = ("下次執行時間", "Next Run Time")
+_NEXT_RUN_VALUE = re.compile(r"[：:]\s*([\d/\-]+)\s+(\d{1,2}[：:]\d{2})")
+# "HH:MM" time as saved in the config file
+_SAVED_TIME = re.compile(r"\d{1,2}:\d{2}")
+
+
+def _hour_to_24h(hour, ampm):
+    """Convert a 12-hour clock hour to its 24-hour value"""
+    if ampm == "PM" and hour != 12:
+        return hour + 12
+    if ampm == "AM" and hour == 12:
+        return 0
+    return hour
+
+
+def _format_time_24h(hour, minute, is_12h, ampm):
+    """Build the "HH:MM" string from the raw picker values"""
+    hour = int(hour)
+    if is_12h:
+        hour = _hour_to_24h(hour, ampm)
+    return f"{hour:02d}:{int(minute):02d}"
+
+
+def _draw_rounded_rect(canvas, x1, y1, x2, y2, r, fill, outline=None):
+    """Draw a rounded rectangle tagged "bg" as one smoothed canvas polygon"""
+    # Each corner point is repeated so the spline bends only at the corners
+    points = (
+        x1 + r, y1, x1 + r, y1, x2 - r, y1, x2 - r, y1,
+        x2, y1, x2, y1 + r, x2, y1 + r, x2, y2 - r, x2, y2 - r,
+        x2, y2, x2 - r, y2, x2 - r, y2, x1 + r, y2, x1 + r, y2,
+        x1, y2, x1, y2 - r, x1, y2 - r, x1, y1 + r, x1, y1 + r,
+        x1, y1,
+    )
+    canvas.create_polygon(
+        points,
+        smooth=True,
+        fill=fill,
+        outline=outline or fill,
+        tags="bg",
+    )
+
 
 class AutoShutdownWindow:
     """Modern application window for auto shutdown scheduling"""
@@ -67,10 +120,21 @@ class AutoShutdownWindow:
 
         # Animation state
         self.colon_visible = True
+        self._blink_job = None
+        # Pending after() id that restores the status text after a flash
+        self._status_restore_id = None
+        # Set while scheduler work runs on a background thread
+        self._busy = False
+        # Form values when the saved config started loading
+        self._form_before_load = None
 
         self._create_ui()
-        self._load_saved_config()
+        # Loading the config queries the task scheduler; let the window paint first
+        self.root.after_idle(self._load_saved_config)
         self._start_colon_animation()
+        # Stop blinking while the window is minimized
+        self.root.bind("<Unmap>", self._pause_colon_animation)
+        self.root.bind("<Map>", self._resume_colon_animation)
 
     def _create_ui(self):
         """Create the modern user interface"""
@@ -124,6 +188,29 @@ class AutoShutdownWindow:
         )
         subtitle.pack(anchor="w", pady=(2, 0))
 
+    def _bind_background(self, canvas, draw):
+        """Redraw a canvas background only when the canvas size changes
+
+        Consecutive <Configure> events are coalesced into one redraw at idle
+        time, which then uses the final size.
+        """
+        last_size = [None]
+        pending = [False]
+
+        def redraw():
+            pending[0] = False
+            size = (canvas.winfo_width(), canvas.winfo_height())
+            if size != last_size[0]:
+                last_size[0] = size
+                draw()
+
+        def on_configure(event):
+            if not pending[0]:
+                pending[0] = True
+                canvas.after_idle(redraw)
+
+        canvas.bind("<Configure>", on_configure)
+
     def _create_time_section(self):
         """Create the time display and format toggle"""
         # Outer container for rounded effect
@@ -145,76 +232,14 @@ class AutoShutdownWindow:
             w = time_canvas.winfo_width()
             h = 200
             r = 16
-            # Draw rounded rectangle
-            time_canvas.create_arc(
-                0,
-                0,
-                2 * r,
-                2 * r,
-                start=90,
-                extent=90,
-                fill=COLORS["bg_light"],
-                outline=COLORS["bg_light"],
-                tags="bg",
-            )
-            time_canvas.create_arc(
-                w - 2 * r,
-                0,
-                w,
-                2 * r,
-                start=0,
-                extent=90,
-                fill=COLORS["bg_light"],
-                outline=COLORS["bg_light"],
-                tags="bg",
-            )
-            time_canvas.create_arc(
-                0,
-                h - 2 * r,
-                2 * r,
-                h,
-                start=180,
-                extent=90,
-                fill=COLORS["bg_light"],
-                outline=COLORS["bg_light"],
-                tags="bg",
-            )
-            time_canvas.create_arc(
-                w - 2 * r,
-                h - 2 * r,
-                w,
-                h,
-                start=270,
-                extent=90,
-                fill=COLORS["bg_light"],
-                outline=COLORS["bg_light"],
-                tags="bg",
-            )
-            time_canvas.create_rectangle(
-                r,
-                0,
-                w - r,
-                h,
-                fill=COLORS["bg_light"],
-                outline=COLORS["bg_light"],
-                tags="bg",
-            )
-            time_canvas.create_rectangle(
-                0,
-                r,
-                w,
-                h - r,
-                fill=COLORS["bg_light"],
-                outline=COLORS["bg_light"],
-                tags="bg",
-            )
+            _draw_rounded_rect(time_canvas, 0, 0, w, h, r, COLORS["bg_light"])
             # Top accent line
             time_canvas.create_rectangle(
                 0, 0, w, 3, fill=COLORS["primary"], outline=COLORS["primary"], tags="bg"
             )
             time_canvas.tag_lower("bg")
 
-        time_canvas.bind("<Configure>", draw_rounded_bg)
+        self._bind_background(time_canvas, draw_rounded_bg)
 
         # Inner frame for content
         inner_frame = tk.Frame(time_canvas, bg=COLORS["bg_light"])
@@ -327,8 +352,7 @@ class AutoShutdownWindow:
         days_frame.pack(fill="x")
 
         # Use grid for even distribution
-        for i in range(7):
-            days_frame.grid_columnconfigure(i, weight=1)
+        days_frame.grid_columnconfigure(tuple(range(len(WEEKDAY_NAMES))), weight=1)
 
         # Default selected days from config
         for i, name in enumerate(WEEKDAY_NAMES):
@@ -359,71 +383,10 @@ class AutoShutdownWindow:
             w = repeat_canvas.winfo_width()
             h = 72
             r = 16
-            repeat_canvas.create_arc(
-                0,
-                0,
-                2 * r,
-                2 * r,
-                start=90,
-                extent=90,
-                fill=COLORS["bg_light"],
-                outline=COLORS["bg_light"],
-                tags="bg",
-            )
-            repeat_canvas.create_arc(
-                w - 2 * r,
-                0,
-                w,
-                2 * r,
-                start=0,
-                extent=90,
-                fill=COLORS["bg_light"],
-                outline=COLORS["bg_light"],
-                tags="bg",
-            )
-            repeat_canvas.create_arc(
-                0,
-                h - 2 * r,
-                2 * r,
-                h,
-                start=180,
-                extent=90,
-                fill=COLORS["bg_light"],
-                outline=COLORS["bg_light"],
-                tags="bg",
-            )
-            repeat_canvas.create_arc(
-                w - 2 * r,
-                h - 2 * r,
-                w,
-                h,
-                start=270,
-                extent=90,
-                fill=COLORS["bg_light"],
-                outline=COLORS["bg_light"],
-                tags="bg",
-            )
-            repeat_canvas.create_rectangle(
-                r,
-                0,
-                w - r,
-                h,
-                fill=COLORS["bg_light"],
-                outline=COLORS["bg_light"],
-                tags="bg",
-            )
-            repeat_canvas.create_rectangle(
-                0,
-                r,
-                w,
-                h - r,
-                fill=COLORS["bg_light"],
-                outline=COLORS["bg_light"],
-                tags="bg",
-            )
+            _draw_rounded_rect(repeat_canvas, 0, 0, w, h, r, COLORS["bg_light"])
             repeat_canvas.tag_lower("bg")
 
-        repeat_canvas.bind("<Configure>", draw_rounded_bg)
+        self._bind_background(repeat_canvas, draw_rounded_bg)
 
         inner_frame = tk.Frame(repeat_canvas, bg=COLORS["bg_light"])
         inner_frame.place(relx=0.5, rely=0.5, anchor="center", relwidth=0.9)
@@ -496,81 +459,20 @@ class AutoShutdownWindow:
             w = help_canvas.winfo_width()
             h = help_canvas.winfo_height()
             r = 16
-            # Border
-            help_canvas.create_arc(
-                0,
+            # Keep the outline inside the canvas so every edge is visible
+            _draw_rounded_rect(
+                help_canvas,
                 0,
-                2 * r,
-                2 * r,
-                start=90,
-                extent=90,
-                outline=COLORS["border"],
-                style="arc",
-                width=1,
-                tags="bg",
-            )
-            help_canvas.create_arc(
-                w - 2 * r,
                 0,
-                w,
-                2 * r,
-                start=0,
-                extent=90,
-                outline=COLORS["border"],
-                style="arc",
-                width=1,
-                tags="bg",
-            )
-            help_canvas.create_arc(
-                0,
-                h - 2 * r,
-                2 * r,
-                h,
-                start=180,
-                extent=90,
-                outline=COLORS["border"],
-                style="arc",
-                width=1,
-                tags="bg",
-            )
-            help_canvas.create_arc(
-                w - 2 * r,
-                h - 2 * r,
-                w,
-                h,
-                start=270,
-                extent=90,
-                outline=COLORS["border"],
-                style="arc",
-                width=1,
-                tags="bg",
-            )
-            help_canvas.create_line(r, 0, w - r, 0, fill=COLORS["border"], tags="bg")
-            help_canvas.create_line(r, h, w - r, h, fill=COLORS["border"], tags="bg")
-            help_canvas.create_line(0, r, 0, h - r, fill=COLORS["border"], tags="bg")
-            help_canvas.create_line(w, r, w, h - r, fill=COLORS["border"], tags="bg")
-            # Fill inside
-            help_canvas.create_rectangle(
-                r,
-                1,
-                w - r,
+                w - 1,
                 h - 1,
-                fill=COLORS["surface_light"],
-                outline=COLORS["surface_light"],
-                tags="bg",
-            )
-            help_canvas.create_rectangle(
-                1,
                 r,
-                w - 1,
-                h - r,
-                fill=COLORS["surface_light"],
-                outline=COLORS["surface_light"],
-                tags="bg",
+                COLORS["surface_light"],
+                COLORS["border"],
             )
             help_canvas.tag_lower("bg")
 
-        help_canvas.bind("<Configure>", draw_rounded_border)
+        self._bind_background(help_canvas, draw_rounded_border)
 
         self.help_section = CollapsibleSection(help_canvas, title="使用說明與提示")
         self.help_section.place(relx=0.5, rely=0.5, anchor="center", relwidth=0.9)
@@ -579,6 +481,9 @@ class AutoShutdownWindow:
         original_toggle = self.help_section._toggle
 
         def new_toggle(event=None):
+            # Tips stay unbuilt while the section is collapsed
+            if not self.help_section.content.winfo_children():
+                self._create_help_tips()
             original_toggle(event)
             # Update canvas height and window size
             if self.help_section.is_expanded:
@@ -597,18 +502,19 @@ class AutoShutdownWindow:
         self.help_section.arrow_label.bind("<Button-1>", new_toggle)
         self.help_section.icon_label.bind("<Button-1>", new_toggle)
 
-        # Add help content
-        for tip in HELP_TIPS:
-            tip_label = tk.Label(
-                self.help_section.content,
-                text=tip,
-                font=FONTS["small"],
-                fg=COLORS["text_sub"],
-                bg=COLORS["bg_light"],
-                anchor="w",
-                justify="left",
-            )
-            tip_label.pack(fill="x", padx=8, pady=2)
+    def _create_help_tips(self):
+        """Fill the help section, built on first expand"""
+        # One multi-line label instead of a label per tip
+        tips_label = tk.Label(
+            self.help_section.content,
+            text="\n".join(HELP_TIPS),
+            font=FONTS["small"],
+            fg=COLORS["text_sub"],
+            bg=COLORS["bg_light"],
+            anchor="w",
+            justify="left",
+        )
+        tips_label.pack(fill="x", padx=8, pady=2)
 
     def _create_status_section(self):
         """Create status indicator"""
@@ -663,10 +569,22 @@ class AutoShutdownWindow:
     def _start_colon_animation(self):
         """Animate the colon blinking"""
         self.colon_visible = not self.colon_visible
-        self.colon_label.config(
-            fg=COLORS["text_main"] if self.colon_visible else COLORS["bg_light"]
+        self.colon_label.config(fg=_COLON_COLORS[self.colon_visible])
+        self._blink_job = self.root.after(
+            COLON_BLINK_INTERVAL, self._start_colon_animation
         )
-        self.root.after(COLON_BLINK_INTERVAL, self._start_colon_animation)
+
+    def _pause_colon_animation(self, event):
+        """Cancel the pending blink when the main window is unmapped"""
+        # Root bindings also fire for child widgets; only react to the window
+        if event.widget is self.root and self._blink_job is not None:
+            self.root.after_cancel(self._blink_job)
+            self._blink_job = None
+
+    def _resume_colon_animation(self, event):
+        """Restart blinking once the main window is mapped again"""
+        if event.widget is self.root and self._blink_job is None:
+            self._start_colon_animation()
 
     def _on_format_change(self):
         """Handle time format change"""
@@ -675,14 +593,7 @@ class AutoShutdownWindow:
         if is_24h:
             self.ampm_label.pack_forget()
             # Convert from 12h to 24h if needed
-            hour = int(self.hour_var.get())
-            ampm = self.ampm_var.get()
-
-            if ampm == "PM" and hour != 12:
-                hour += 12
-            elif ampm == "AM" and hour == 12:
-                hour = 0
-
+            hour = _hour_to_24h(int(self.hour_var.get()), self.ampm_var.get())
             self.hour_var.set(f"{hour:02d}")
         else:
             self.ampm_label.pack(side="left", padx=(8, 0))
@@ -701,24 +612,18 @@ class AutoShutdownWindow:
     def _show_hour_picker(self, event=None):
         """Show hour picker popup"""
         self._show_number_picker(
-            self.hour_var, 24 if self.time_format_var.get() == "24小時" else 12, "hour"
+            self.hour_var,
+            _HOURS_24 if self.time_format_var.get() == "24小時" else _HOURS_12,
         )
 
     def _show_minute_picker(self, event=None):
         """Show minute picker popup"""
-        self._show_number_picker(self.minute_var, 60, "minute")
+        self._show_number_picker(self.minute_var, _MINUTES)
 
-    def _show_number_picker(self, var, max_val, picker_type):
+    def _show_number_picker(self, var, values):
         """Show a popup number picker"""
         popup = self._create_picker_popup()
-        canvas, scrollbar, inner_frame = self._create_scrollable_container(popup)
-
-        start_val, end_val = self._get_picker_range(picker_type, max_val)
-        self._create_picker_buttons(inner_frame, var, start_val, end_val, popup)
-
-        self._setup_picker_scrolling(
-            canvas, scrollbar, inner_frame, var, start_val, end_val
-        )
+        self._create_picker_list(popup, var, values)
         self._setup_picker_events(popup)
 
     def _create_picker_popup(self):
@@ -738,82 +643,49 @@ class AutoShutdownWindow:
 
         return popup
 
-    def _create_scrollable_container(self, popup):
-        """Create scrollable container for picker buttons"""
-        inner_container = tk.Frame(popup, bg=COLORS["surface_light"])
-        inner_container.pack(fill="both", expand=True)
+    def _create_picker_list(self, popup, var, values):
+        """Create a single scrollable list holding every picker value"""
+        container = tk.Frame(popup, bg=COLORS["surface_light"])
+        container.pack(fill="both", expand=True)
 
-        canvas = tk.Canvas(
-            inner_container,
-            width=80,
-            height=200,
+        # One Listbox instead of a Label (plus bindings) per value
+        listbox = tk.Listbox(
+            container,
+            font=FONTS["body"],
+            fg=COLORS["text_main"],
             bg=COLORS["surface_light"],
+            selectbackground=COLORS["bg_light"],
+            selectforeground=COLORS["primary"],
+            activestyle="none",
+            borderwidth=0,
             highlightthickness=0,
+            justify="center",
+            cursor="hand2",
+            exportselection=False,
         )
-        canvas.pack(side="left", fill="both", expand=True)
-
-        scrollbar = tk.Scrollbar(
-            inner_container, orient="vertical", command=canvas.yview
-        )
+        scrollbar = tk.Scrollbar(container, orient="vertical", command=listbox.yview)
+        listbox.configure(yscrollcommand=scrollbar.set)
         scrollbar.pack(side="right", fill="y")
+        listbox.pack(side="left", fill="both", expand=True)
 
-        canvas.configure(yscrollcommand=scrollbar.set)
-
-        inner_frame = tk.Frame(canvas, bg=COLORS["surface_light"])
-        canvas.create_window((0, 0), window=inner_frame, anchor="nw")
-
-        return canvas, scrollbar, inner_frame
+        listbox.insert("end", *values)
 
-    def _get_picker_range(self, picker_type, max_val):
-        """Get the start and end values for picker based on type"""
-        if picker_type == "hour":
-            if self.time_format_var.get() == "24小時":
-                return 0, max_val
-            else:
-                return 1, 13
-        else:  # minute
-            return 0, max_val
-
-    def _create_picker_buttons(self, inner_frame, var, start_val, end_val, popup):
-        """Create number selection buttons"""
-        current_val = var.get()
-        for i in range(start_val, end_val):
-            val = f"{i:02d}"
-            is_current = val == current_val
-            btn = tk.Label(
-                inner_frame,
-                text=val,
-                font=(
-                    FONTS["body"] if not is_current else (FONTS["body"][0], 10, "bold")
-                ),
-                fg=COLORS["primary"] if is_current else COLORS["text_main"],
-                bg=COLORS["surface_light"],
-                cursor="hand2",
-                width=6,
-                pady=6,
-            )
-            btn.pack(fill="x")
-            btn.bind("<Button-1>", lambda e, v=val: self._select_number(var, v, popup))
-            btn.bind("<Enter>", lambda e, b=btn: b.config(bg=COLORS["bg_light"]))
-            btn.bind("<Leave>", lambda e, b=btn: b.config(bg=COLORS["surface_light"]))
-
-    def _setup_picker_scrolling(
-        self, canvas, scrollbar, inner_frame, var, start_val, end_val
-    ):
-        """Setup scrolling and position to current value"""
-        inner_frame.update_idletasks()
-        canvas.configure(scrollregion=canvas.bbox("all"))
-
-        # Scroll to current value
+        # Highlight the current value and scroll it near the top
         try:
-            current_val = var.get()
-            current_idx = int(current_val) - start_val
-            if current_idx > 0:
-                canvas.yview_moveto(
-                    max(0, (current_idx - 3) / max(1, end_val - start_val))
-                )
-        except (ValueError, ZeroDivisionError):
+            current_idx = values.index(var.get())
+        except ValueError:
             pass
+        else:
+            listbox.selection_set(current_idx)
+            listbox.yview(max(0, current_idx - 3))
+
+        listbox.bind(
+            "<ButtonRelease-1>",
+            lambda e: self._select_number(
+                var, listbox.get(listbox.nearest(e.y)), popup
+            ),
+        )
+        return listbox
 
     def _setup_picker_events(self, popup):
         """Setup popup close events"""
@@ -824,16 +696,35 @@ class AutoShutdownWindow:
             except tk.TclError:
                 pass
 
-        popup.bind("<Escape>", close_popup)
-        popup.bind("<FocusOut>", close_popup)
-
-        # Also close when clicking anywhere on the root window
-        def on_root_click(event):
-            close_popup()
-            self.root.unbind("<Button-1>")
+        def close_if_unfocused():
+            try:
+                focus = popup.focus_get()
+            except (KeyError, tk.TclError):
+                focus = None
+            if focus is None or focus.winfo_toplevel() is not popup:
+                close_popup()
+
+        def on_focus_out(event):
+            # Focus may only be moving to the list inside the popup
+            popup.after_idle(close_if_unfocused)
+
+        def on_click(event):
+            # While the grab is held, clicks anywhere in the app arrive here
+            left, top = popup.winfo_rootx(), popup.winfo_rooty()
+            inside = (
+                left <= event.x_root < left + popup.winfo_width()
+                and top <= event.y_root < top + popup.winfo_height()
+            )
+            if not inside:
+                close_popup()
 
-        self.root.bind("<Button-1>", on_root_click)
+        popup.bind("<Escape>", close_popup)
+        popup.bind("<FocusOut>", on_focus_out)
+        popup.bind("<Button-1>", on_click)
         popup.focus_set()
+        # A grab can only be set once the popup is mapped
+        popup.wait_visibility()
+        popup.grab_set()
 
     def _select_number(self, var, value, popup):
         """Select a number from picker"""
@@ -853,44 +744,98 @@ class AutoShutdownWindow:
 
     def _get_time_24h(self):
         """Get time in 24-hour format"""
-        hour = int(self.hour_var.get())
-        minute = int(self.minute_var.get())
+        return _format_time_24h(
+            self.hour_var.get(),
+            self.minute_var.get(),
+            self.time_format_var.get() == "12小時",
+            self.ampm_var.get(),
+        )
 
-        if self.time_format_var.get() == "12小時":
-            if self.ampm_var.get() == "PM" and hour != 12:
-                hour += 12
-            elif self.ampm_var.get() == "AM" and hour == 12:
-                hour = 0
+    def _run_in_background(self, work, on_success, on_error):
+        """Run scheduler work off the Tk thread and report back on it
 
-        return f"{hour:02d}:{minute:02d}"
+        The worker only touches a queue; the Tk thread polls it with after()
+        and calls on_success(result) or on_error(exception).
+        """
+        self._busy = True
+        self._set_actions_enabled(False)
+        results = queue.Queue(maxsize=1)
+
+        def worker():
+            try:
+                results.put((on_success, work()))
+            except Exception as e:
+                results.put((on_error, e))
+            finally:
+                # COM is initialized per thread; release it before the thread ends
+                self.scheduler.release_com()
+
+        def poll():
+            try:
+                callback, value = results.get_nowait()
+            except queue.Empty:
+                self.root.after(_WORKER_POLL_INTERVAL, poll)
+                return
+            self._busy = False
+            self._set_actions_enabled(True)
+            callback(value)
+
+        threading.Thread(target=worker, daemon=True).start()
+        self.root.after(_WORKER_POLL_INTERVAL, poll)
+
+    def _set_actions_enabled(self, enabled):
+        """Enable or disable the action buttons while work is in progress"""
+        for button in (self.set_button, self.cancel_button, self.check_button):
+            button.set_enabled(enabled)
 
     def _schedule_shutdown(self):
         """Schedule system shutdown"""
+        if self._busy:
+            return
         try:
             time_str = self._get_time_24h()
             selected_days = self._get_selected_days()
+        except ValueError as e:
+            self._on_schedule_error(e)
+            return
+
+        if not selected_days:
+            self._show_validation_error(MESSAGES.validation_error)
+            return
+
+        is_repeat = self.repeat_var.get()
+        # schtasks can take a while; keep the window responsive meanwhile
+        self._run_in_background(
+            lambda: self.scheduler.create_schedule(selected_days, time_str, is_repeat),
+            self._on_schedule_done,
+            self._on_schedule_error,
+        )
 
-            if not selected_days:
-                self._show_validation_error(MESSAGES["validation_error"])
-                return
-
-            is_repeat = self.repeat_var.get()
-            self.scheduler.create_schedule(selected_days, time_str, is_repeat)
-
-            self._update_status("active", MESSAGES["active_status"])
-            # Ensure UI updates are processed before showing messagebox
-            self.root.update_idletasks()
-            self._show_success_message(MESSAGES["success_scheduled"])
+    def _on_schedule_done(self, result):
+        """Report a successfully created schedule"""
+        self._flash_status("active", MESSAGES.success_scheduled, MESSAGES.active_status)
 
-        except ValueError as e:
+    def _on_schedule_error(self, e):
+        """Report why creating the schedule failed"""
+        if isinstance(e, ValueError):
             logger.warning(f"Validation error: {str(e)}")
             self._show_validation_error(str(e))
-        except PermissionError as e:
+        elif isinstance(e, PermissionError):
             logger.error(f"Permission denied: {str(e)}")
             self._show_permission_error()
-        except Exception as e:
+        else:
             logger.error(f"Failed to schedule shutdown: {str(e)}")
-            self._show_general_error("設定排程失敗", str(e))
+            self._show_general_error(
+                "設定排程失敗", getattr(e, "user_message", str(e))
+            )
+
+    def _set_selected_days(self, days):
+        """Select exactly the given weekdays (1-7)"""
+        # Only write variables that change; each write redraws its day button
+        for i, var in enumerate(self.weekday_vars):
+            selected = (i + 1) in days
+            if var.get() != selected:
+                var.set(selected)
 
     def _get_selected_days(self):
         """Get list of selected weekdays"""
@@ -898,64 +843,103 @@ class AutoShutdownWindow:
 
     def _show_validation_error(self, message):
         """Show validation error message"""
-        messagebox.showerror(MESSAGES["input_error"], message)
+        self._show_general_error(MESSAGES.input_error, message)
 
     def _show_permission_error(self):
         """Show permission error message with help"""
-        messagebox.showerror(MESSAGES["error_title"], MESSAGES["permission_error"])
+        self._show_general_error(MESSAGES.error_title, MESSAGES.permission_error)
 
     def _show_general_error(self, title, message):
         """Show general error message"""
+        # Dialogs are only needed once the user acts, so defer the import
+        from tkinter import messagebox
+
         messagebox.showerror(title, message)
 
-    def _show_success_message(self, message):
-        """Show success message"""
-        messagebox.showinfo(MESSAGES["success_title"], message)
+    def _show_info(self, title, message):
+        """Show informational message"""
+        from tkinter import messagebox
+
+        messagebox.showinfo(title, message)
 
     def _cancel_shutdown(self):
         """Cancel scheduled shutdown"""
-        try:
-            self.scheduler.remove_schedule()
-            self._update_status("inactive", MESSAGES["inactive_status"])
-            messagebox.showinfo(MESSAGES["success_title"], MESSAGES["success_canceled"])
-        except Exception as e:
-            logger.error(f"Failed to cancel shutdown: {str(e)}")
-            messagebox.showerror(MESSAGES["error_title"], str(e))
+        if self._busy:
+            return
+        # Deleting the task runs schtasks; keep the window responsive meanwhile
+        self._run_in_background(
+            self.scheduler.remove_schedule,
+            self._on_cancel_done,
+            self._on_cancel_error,
+        )
+
+    def _on_cancel_done(self, result):
+        """Report a successfully removed schedule"""
+        self._flash_status(
+            "inactive", MESSAGES.success_canceled, MESSAGES.inactive_status
+        )
+
+    def _on_cancel_error(self, e):
+        """Report why removing the schedule failed"""
+        logger.error(f"Failed to cancel shutdown: {str(e)}")
+        self._show_general_error(
+            MESSAGES.error_title, getattr(e, "user_message", str(e))
+        )
 
     def _check_schedule(self):
         """Check current schedule status"""
-        try:
-            task_info = self.scheduler.get_schedule_info()
-            if task_info and "找不到" not in task_info:
-                self._update_status("active", MESSAGES["active_status"])
-            else:
-                self._update_status("inactive", MESSAGES["inactive_status"])
-            messagebox.showinfo(MESSAGES["schedule_status"], task_info)
-        except Exception as e:
-            logger.error(f"Failed to check schedule: {str(e)}")
-            messagebox.showerror(MESSAGES["error_title"], str(e))
+        if self._busy:
+            return
+        # 使用者主動檢查時向任務排程器確認實際狀態，而非只讀設定檔
+        self._run_in_background(
+            lambda: self.scheduler.get_schedule_info(verify=True),
+            self._on_check_done,
+            self._on_check_error,
+        )
+
+    def _on_check_done(self, task_info):
+        """Show the schedule state reported by the task scheduler"""
+        if task_info and "找不到" not in task_info:
+            self._update_status("active", MESSAGES.active_status)
+        else:
+            self._update_status("inactive", MESSAGES.inactive_status)
+        self._show_info(MESSAGES.schedule_status, task_info)
+
+    def _on_check_error(self, e):
+        """Report why checking the schedule failed"""
+        logger.error(f"Failed to check schedule: {str(e)}")
+        self._show_general_error(
+            MESSAGES.error_title, getattr(e, "user_message", str(e))
+        )
 
     def _update_status(self, status, text):
         """Update status indicator"""
+        if self._status_restore_id is not None:
+            self.root.after_cancel(self._status_restore_id)
+            self._status_restore_id = None
         self.status_indicator.set_status(status, text)
 
+    def _flash_status(self, status, message, text):
+        """Show a transient message in the status indicator, then settle on text"""
+        # Success is reported inline instead of through a modal dialog
+        self._update_status(status, message)
+        self._status_restore_id = self.root.after(
+            STATUS_FLASH_DURATION, lambda: self._update_status(status, text)
+        )
+
     def _parse_schedule_time_from_info(self, task_info):
         """Parse time and weekdays from task scheduler info string"""
-        import re
         result = {"time": None, "weekdays": None}
         
         if not task_info or "找不到" in task_info:
             return result
             
         try:
-            # Parse next run time - formats like "2026/1/14 23:30:00" or "2026-01-14 23:30:00"
-            next_run_patterns = [
-                r"下次執行時間[：:]\s*([\d/\-]+)\s+(\d{1,2}[：:]\d{2})",
-                r"Next Run Time[：:]\s*([\d/\-]+)\s+(\d{1,2}[：:]\d{2})",
-            ]
-            
-            for pattern in next_run_patterns:
-                match = re.search(pattern, task_info)
+            for label in _NEXT_RUN_LABELS:
+                pos = task_info.find(label)
+                if pos < 0:
+                    continue
+                match = _NEXT_RUN_VALUE.match(task_info, pos + len(label))
                 if match:
                     time_str = match.group(2).replace("：", ":")
                     parts = time_str.split(":")
@@ -971,40 +955,79 @@ class AutoShutdownWindow:
 
     def _load_saved_config(self):
         """Load saved configuration"""
+        # 查詢任務排程器可能需要一段時間，在背景執行緒取得資料後再套用到畫面
+        self._form_before_load = self._form_state()
+        self._run_in_background(
+            self._fetch_saved_schedule,
+            self._apply_saved_schedule,
+            self._on_load_error,
+        )
+
+    def _fetch_saved_schedule(self):
+        """Read the saved config and task state (runs off the Tk thread)"""
         # 檢查是否有執行中的排程
         has_active = self.scheduler.has_active_schedule()
         config = self.scheduler.load_config()
+        # 設定檔沒有可用的時間時改由任務排程器的資訊取得，同樣在背景執行緒查詢
+        task_info = None
+        if has_active and not (
+            config and _SAVED_TIME.fullmatch(str(config.get("time") or ""))
+        ):
+            task_info = self.scheduler.get_schedule_info()
+        return has_active, config, task_info
+
+    def _form_state(self):
+        """Snapshot the user-editable time and weekday inputs"""
+        return (
+            self.hour_var.get(),
+            self.minute_var.get(),
+            self.time_format_var.get(),
+            self.ampm_var.get(),
+            self.repeat_var.get(),
+            tuple(self._get_selected_days()),
+        )
+
+    def _apply_time(self, time_str):
+        """Show an "HH:MM" time in the hour and minute displays"""
+        hour, minute = map(int, time_str.split(":"))
+        self.hour_var.set(f"{hour:02d}")
+        self.minute_var.set(f"{minute:02d}")
+
+    def _on_load_error(self, e):
+        """Fall back to defaults when the saved schedule cannot be read"""
+        logger.error(f"Failed to load saved schedule: {str(e)}")
+        self._apply_saved_schedule((False, None, None))
+
+    def _apply_saved_schedule(self, data):
+        """Show the loaded schedule in the window"""
+        has_active, config, task_info = data
 
         # 如果有執行中的排程，無論是否有設定檔，都顯示為已啟用
         if has_active:
             self._update_status("active", "已設定排程")
 
+        # 載入期間使用者已修改表單時，保留使用者的輸入
+        if self._form_state() != self._form_before_load:
+            logger.info("Form edited while loading, keeping user input")
+            return
+
         # 嘗試載入設定
         config_loaded = False
         if config:
             try:
                 # Set weekday checkboxes
-                saved_weekdays = config.get("weekdays", [])
-                if saved_weekdays:
-                    if all(isinstance(x, bool) for x in saved_weekdays):
-                        for var, enabled in zip(self.weekday_vars, saved_weekdays):
-                            var.set(enabled)
-                    else:
-                        try:
-                            days = [int(x) for x in saved_weekdays]
-                            for i, var in enumerate(self.weekday_vars):
-                                var.set((i + 1) in days)
-                        except Exception:
-                            logger.debug(
-                                "Unexpected format for saved weekdays, ignoring"
-                            )
+                if config.get("weekdays"):
+                    try:
+                        self._set_selected_days(
+                            set(self.scheduler.config_weekdays(config))
+                        )
+                    except (TypeError, ValueError):
+                        logger.debug("Unexpected format for saved weekdays, ignoring")
 
                 # Set time
                 time_str = config.get("time")
                 if time_str:
-                    hour, minute = map(int, time_str.split(":"))
-                    self.hour_var.set(f"{hour:02d}")
-                    self.minute_var.set(f"{minute:02d}")
+                    self._apply_time(time_str)
 
                 # Set execution mode
                 self.repeat_var.set(config.get("is_repeat", True))
@@ -1017,13 +1040,10 @@ class AutoShutdownWindow:
         # 如果沒有載入設定但有活躍排程，嘗試從 Windows 任務排程器解析時間
         if not config_loaded and has_active:
             try:
-                task_info = self.scheduler.get_schedule_info()
                 parsed = self._parse_schedule_time_from_info(task_info)
                 
                 if parsed["time"]:
-                    hour, minute = map(int, parsed["time"].split(":"))
-                    self.hour_var.set(f"{hour:02d}")
-                    self.minute_var.set(f"{minute:02d}")
+                    self._apply_time(parsed["time"])
                     config_loaded = True
                     logger.info(f"Loaded time from scheduler: {parsed['time']}")
             except Exception as e:
@@ -1031,19 +1051,21 @@ class AutoShutdownWindow:
 
         # 如果仍然沒有載入設定（首次執行），使用預設值
         if not config_loaded:
+            from datetime import datetime
+
             now = datetime.now()
+            hh, mm = f"{now.hour:02d}", f"{now.minute:02d}"
 
             # 設定當前時間
-            self.hour_var.set(f"{now.hour:02d}")
-            self.minute_var.set(f"{now.minute:02d}")
+            self.hour_var.set(hh)
+            self.minute_var.set(mm)
 
             # 設定當天星期（weekday() 返回 0-6，0是星期一）
             today_weekday = now.weekday()
-            for i, var in enumerate(self.weekday_vars):
-                var.set(i == today_weekday)
+            self._set_selected_days({today_weekday + 1})
 
             logger.info(
-                f"Auto-selected today ({WEEKDAY_NAMES[today_weekday]}) and current time {now.hour:02d}:{now.minute:02d}"
+                f"Auto-selected today ({WEEKDAY_NAMES[today_weekday]}) and current time {hh}:{mm}"
             )
 
     def run(self):
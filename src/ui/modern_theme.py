@@ -65,9 +65,12 @@ def get_font_fallback():
             "sans-serif"
         ]
 
+# 平台在執行期間不會改變，匯入時只查詢一次
+_FONT_FAMILIES = get_font_fallback()
+
 def get_safe_font(base_font_name, size, style="normal"):
     """取得具有備用機制的字體"""
-    font_families = get_font_fallback()
+    font_families = _FONT_FAMILIES
     
     # 先嘗試要求的字體，然後備用
     for family in font_families:
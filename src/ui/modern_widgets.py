@@ -177,9 +177,11 @@ class PillToggle(tk.Canvas):
             x_start = self.padding + i * self.button_width
             x_end = x_start + self.button_width
             if x_start <= event.x <= x_end:
-                self.variable.set(opt)
-                if self.command:
-                    self.command()
+                # 點擊目前已選取的選項時不重複觸發 command
+                if opt != self.variable.get():
+                    self.variable.set(opt)
+                    if self.command:
+                        self.command()
                 break
 
 
@@ -262,6 +264,7 @@ class ModernButton(tk.Canvas):
 
         self.is_hovered = False
         self.is_pressed = False
+        self.enabled = True
         self._draw()
 
         self.bind("<Button-1>", self._on_click)
@@ -281,6 +284,12 @@ class ModernButton(tk.Canvas):
 
         text_color = COLORS["text_white"] if self.primary else COLORS["text_main"]
 
+        # 停用時以淡色顯示，且不呈現懸停效果
+        if not self.enabled:
+            fill_color = COLORS["primary_light"] if self.primary else COLORS["bg_light"]
+            if not self.primary:
+                text_color = COLORS["inactive"]
+
         r = 12
         w, h = self.width, self.height
         y_offset = 2 if self.is_pressed and self.primary else 0
@@ -313,14 +322,24 @@ class ModernButton(tk.Canvas):
         self.create_rectangle(x + r, y, w - r, h, fill=fill_color, outline=fill_color)
         self.create_rectangle(x, y + r, w, h - r, fill=fill_color, outline=fill_color)
 
+    def set_enabled(self, enabled):
+        """啟用或停用按鈕，停用時點擊不會執行命令"""
+        if self.enabled == enabled:
+            return
+        self.enabled = enabled
+        self.is_pressed = False
+        self._draw()
+
     def _on_click(self, event):
+        if not self.enabled:
+            return
         self.is_pressed = True
         self._draw()
 
     def _on_release(self, event):
         self.is_pressed = False
         self._draw()
-        if self.command:
+        if self.command and self.enabled:
             # 檢查釋放是否在按鈕範圍內
             if 0 <= event.x <= self.width and 0 <= event.y <= self.height:
                 self.command()
@@ -403,8 +422,17 @@ class CollapsibleSection(tk.Frame):
 class StatusIndicator(tk.Frame):
     """帶有彩色圓點的狀態指示器"""
 
+    STATUS_COLORS = {
+        "active": COLORS["success"],
+        "inactive": COLORS["error"],
+        "warning": COLORS["warning"],
+        "error": COLORS["error"]
+    }
+
     def __init__(self, parent, **kwargs):
         super().__init__(parent, bg=kwargs.pop("bg", COLORS["surface_light"]), **kwargs)
+        # 目前顯示的 (狀態, 文字)，相同時不重畫
+        self._shown = None
 
         self.dot = tk.Canvas(
             self,
@@ -428,14 +456,11 @@ class StatusIndicator(tk.Frame):
 
     def set_status(self, status, text):
         """設定狀態：'active'、'inactive'、'warning'、'error'"""
-        colors = {
-            "active": COLORS["success"],
-            "inactive": COLORS["error"],
-            "warning": COLORS["warning"],
-            "error": COLORS["error"]
-        }
+        if self._shown == (status, text):
+            return
+        self._shown = (status, text)
 
         self.dot.delete("all")
-        color = colors.get(status, COLORS["inactive"])
+        color = self.STATUS_COLORS.get(status, COLORS["inactive"])
         self.dot.create_oval(1, 1, 9, 9, fill=color, outline=color)
         self.label.config(text=f"目前狀態：{text}")
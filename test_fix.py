@@ -8,6 +8,7 @@ from unittest.mock import patch, MagicMock
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from src.scheduler import ShutdownScheduler
 from src.config import TASK_NAME
+from tests.support import fake_popen
 
 print("=== 測試修復後的程式碼 ===\n")
 
@@ -104,14 +105,18 @@ print(f"模擬任務列表: {mock_task_list}")
 print(f"模擬詳細資訊: {mock_detail_output}")
 
 # 測試 has_active_schedule
-with patch("src.scheduler.subprocess.run") as mock_run:
-    mock_run.return_value = MagicMock(returncode=0, stdout=mock_task_list)
+with patch("src.scheduler.subprocess.Popen", side_effect=fake_popen), patch(
+    "src.scheduler.subprocess.run"
+) as mock_run:
+    mock_run.return_value = MagicMock(returncode=0, stdout=mock_task_list.encode())
     has_active = scheduler.has_active_schedule()
     print(f"\nhas_active_schedule() 結果: {has_active}")
     print(f"狀態: {'✓ 正常' if has_active else '✗ BUG 仍然存在'}")
 
 # 測試 get_schedule_info
-with patch("src.scheduler.subprocess.run") as mock_run:
+with patch("src.scheduler.subprocess.Popen", side_effect=fake_popen), patch(
+    "src.scheduler.subprocess.run"
+) as mock_run:
     mock_run.side_effect = [
         MagicMock(returncode=0, stdout=mock_task_list),
         MagicMock(returncode=0, stdout=mock_detail_output),
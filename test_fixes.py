@@ -44,7 +44,7 @@ def test_constants():
         assert config.WINDOW_WIDTH == 420
         assert config.WINDOW_HEIGHT == 750
         assert config.DEFAULT_HOUR == "23"
-        assert "validation_error" in config.MESSAGES
+        assert hasattr(config.MESSAGES, "validation_error")
         assert len(config.HELP_TIPS) == 3
         assert config.TASK_NAME == "AutomaticShutdownScheduler"
         
@@ -0,0 +1,21 @@
+"""測試與除錯腳本共用的輔助函式"""
+
+import io
+import subprocess
+from unittest.mock import MagicMock
+
+from src.config import SUBPROCESS_ENCODING
+
+
+def fake_popen(args, *a, **kw):
+    """以（已被替換的）subprocess.run 結果模擬 Popen 的串流輸出"""
+    result = subprocess.run(args, *a, **kw)
+    stdout = result.stdout
+    if isinstance(stdout, str):
+        stdout = stdout.encode(SUBPROCESS_ENCODING)
+    elif not isinstance(stdout, bytes):
+        stdout = b""
+    proc = MagicMock(returncode=result.returncode, stdout=io.BytesIO(stdout))
+    proc.__enter__.return_value = proc
+    proc.__exit__.return_value = False
+    return proc
@@ -9,6 +9,7 @@ import locale
 from unittest.mock import patch
 import sys
 import os
+from types import SimpleNamespace
 
 # 添加專案根目錄到路徑
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -30,6 +31,7 @@ from src.config import (
     PADDING_WIDGET,
     CORNER_RADIUS,
     COLON_BLINK_INTERVAL,
+    STATUS_FLASH_DURATION,
     SHUTDOWN_WARNING_TIME,
     CONFIG_FILE_NAME,
     LOG_FILE_NAME,
@@ -99,22 +101,22 @@ class TestConfig(unittest.TestCase):
         self.assertIn(4, DEFAULT_SELECTED_DAYS)  # 星期五
 
     def test_messages(self):
-        """測試訊息字典"""
-        self.assertIsInstance(MESSAGES, dict)
-        self.assertIn("validation_error", MESSAGES)
-        self.assertIn("permission_error", MESSAGES)
-        self.assertIn("success_scheduled", MESSAGES)
-        self.assertIn("success_canceled", MESSAGES)
-        self.assertIn("error_title", MESSAGES)
-        self.assertIn("success_title", MESSAGES)
-        self.assertIn("schedule_status", MESSAGES)
-        self.assertIn("active_status", MESSAGES)
-        self.assertIn("inactive_status", MESSAGES)
+        """測試訊息常數"""
+        self.assertIsInstance(MESSAGES, SimpleNamespace)
+        self.assertTrue(hasattr(MESSAGES, "validation_error"))
+        self.assertTrue(hasattr(MESSAGES, "permission_error"))
+        self.assertTrue(hasattr(MESSAGES, "success_scheduled"))
+        self.assertTrue(hasattr(MESSAGES, "success_canceled"))
+        self.assertTrue(hasattr(MESSAGES, "error_title"))
+        self.assertTrue(hasattr(MESSAGES, "success_title"))
+        self.assertTrue(hasattr(MESSAGES, "schedule_status"))
+        self.assertTrue(hasattr(MESSAGES, "active_status"))
+        self.assertTrue(hasattr(MESSAGES, "inactive_status"))
 
         # 驗證訊息內容
-        self.assertEqual(MESSAGES["validation_error"], "請至少選擇一個星期")
+        self.assertEqual(MESSAGES.validation_error, "請至少選擇一個星期")
         self.assertEqual(
-            MESSAGES["permission_error"],
+            MESSAGES.permission_error,
             "需要管理員權限才能建立排程任務。\n請以系統管理員身份運行程式。",
         )
 
@@ -169,6 +171,7 @@ class TestConfig(unittest.TestCase):
         self.assertIsInstance(WINDOW_HEIGHT, int)
         self.assertIsInstance(TIME_CANVAS_HEIGHT, int)
         self.assertIsInstance(COLON_BLINK_INTERVAL, int)
+        self.assertIsInstance(STATUS_FLASH_DURATION, int)
         self.assertIsInstance(SHUTDOWN_WARNING_TIME, int)
 
         # 字串常數
@@ -214,7 +217,7 @@ class TestConfigIntegration(unittest.TestCase):
             self.assertTrue(0 <= day < 7)
 
         # 確保所有訊息都不為空
-        for key, message in MESSAGES.items():
+        for key, message in vars(MESSAGES).items():
             self.assertIsInstance(message, str)
             self.assertTrue(len(message) > 0)
 
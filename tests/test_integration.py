@@ -65,7 +65,7 @@ class TestSystemIntegration(unittest.TestCase):
         scheduler = ShutdownScheduler()
 
         # 測試可能的任務名稱列表
-        expected_names = [TASK_NAME, "AutomaticS", "AutoShutdown"]
+        expected_names = (TASK_NAME, "AutomaticS", "AutoShutdown")
 
         self.assertEqual(scheduler.possible_task_names, expected_names)
 
@@ -130,27 +130,27 @@ class TestSystemIntegration(unittest.TestCase):
     def test_config_messages_consistency(self):
         """測試配置和訊息的一致性"""
         # 測試訊息常數的完整性
-        self.assertIn("validation_error", MESSAGES)
-        self.assertIn("permission_error", MESSAGES)
-        self.assertIn("success_scheduled", MESSAGES)
-        self.assertIn("success_canceled", MESSAGES)
+        self.assertTrue(hasattr(MESSAGES, "validation_error"))
+        self.assertTrue(hasattr(MESSAGES, "permission_error"))
+        self.assertTrue(hasattr(MESSAGES, "success_scheduled"))
+        self.assertTrue(hasattr(MESSAGES, "success_canceled"))
 
         # 測試訊息內容的合理性
-        self.assertTrue(len(MESSAGES["validation_error"]) > 0)
-        self.assertTrue(len(MESSAGES["permission_error"]) > 0)
-        self.assertTrue(len(MESSAGES["success_scheduled"]) > 0)
-        self.assertTrue(len(MESSAGES["success_canceled"]) > 0)
+        self.assertTrue(len(MESSAGES.validation_error) > 0)
+        self.assertTrue(len(MESSAGES.permission_error) > 0)
+        self.assertTrue(len(MESSAGES.success_scheduled) > 0)
+        self.assertTrue(len(MESSAGES.success_canceled) > 0)
 
     @patch("src.scheduler.subprocess.run")
     def test_scheduler_error_recovery(self, mock_run):
         """測試排程器的錯誤恢復機制"""
         scheduler = ShutdownScheduler()
 
-        # 測試刪除現有任務時的錯誤處理
+        # 測試建立失敗時刪除舊任務後重試
         mock_run.side_effect = [
-            Exception("Access denied"),  # 刪除失敗
-            MagicMock(returncode=0),  # 建立成功
-            MagicMock(returncode=0),  # 驗證成功
+            MagicMock(returncode=1, stderr="Task exists"),  # 建立失敗
+            MagicMock(returncode=0),  # 刪除舊任務
+            MagicMock(returncode=0),  # 重試建立成功
         ]
 
         # 應該不拋出異常，而是記錄警告並繼續
@@ -177,16 +177,14 @@ class TestSystemIntegration(unittest.TestCase):
 
         # 模擬建立和驗證流程
         mock_run.side_effect = [
-            MagicMock(returncode=1, stderr="Access denied"),  # 刪除現有任務失敗
-            MagicMock(returncode=0),  # 建立新任務成功
-            MagicMock(returncode=0),  # 驗證任務成功
+            MagicMock(returncode=0),  # 建立新任務成功（/f 直接覆寫舊任務）
         ]
 
         # 應該成功完成工作流程
         scheduler.create_schedule([1, 2], "13:00", True)
 
-        # 驗證子程序被調用次數
-        self.assertEqual(mock_run.call_count, 3)
+        # 建立成功即視為完成，不再另外查詢驗證
+        self.assertEqual(mock_run.call_count, 1)
 
 
 class TestUIIntegration(unittest.TestCase):
@@ -6,6 +6,7 @@
 
 import unittest
 import tempfile
+import io
 import json
 import os
 from pathlib import Path
@@ -15,8 +16,23 @@ import sys
 # 添加專案根目錄到路徑
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.scheduler import ShutdownScheduler
-from src.config import TASK_NAME, CONFIG_FILE_NAME
+from src.scheduler import ShutdownScheduler, _loads_config
+from src.config import TASK_NAME, CONFIG_FILE_NAME, SUBPROCESS_ENCODING
+from tests.support import fake_popen
+
+
+def fake_schtasks(*rows, header=("HostName", "TaskName", "Next Run Time", "Status")):
+    """建立模擬 schtasks /query /fo csv /v 的 side_effect，rows 依 header 欄位排列"""
+    output = "\r\n".join(
+        ",".join(f'"{value}"' for value in line) for line in (header, *rows)
+    ).encode(SUBPROCESS_ENCODING)
+
+    def run(args, *a, **kw):
+        if "/query" in args:
+            return MagicMock(returncode=0, stdout=output)
+        return MagicMock(returncode=1, stdout=b"")
+
+    return run
 
 
 class TestShutdownScheduler(unittest.TestCase):
@@ -27,6 +43,10 @@ class TestShutdownScheduler(unittest.TestCase):
         self.temp_dir = tempfile.mkdtemp()
         self.scheduler = ShutdownScheduler()
         self.scheduler.config_path = Path(self.temp_dir) / CONFIG_FILE_NAME
+        # 任務列表以 Popen 串流讀取，轉交給各測試替換的 subprocess.run
+        popen_patcher = patch("src.scheduler.subprocess.Popen", side_effect=fake_popen)
+        popen_patcher.start()
+        self.addCleanup(popen_patcher.stop)
 
     def tearDown(self):
         """測試後的清理"""
@@ -58,6 +78,41 @@ class TestShutdownScheduler(unittest.TestCase):
         loaded_config = self.scheduler.load_config()
         self.assertEqual(loaded_config, test_config)
 
+    def test_save_and_load_config_without_orjson(self):
+        """測試未安裝 orjson 時改用標準 json 模組"""
+        test_config = {"weekdays": [1, 7], "time": "08:05", "is_repeat": False}
+
+        with patch("src.scheduler.orjson", None):
+            self.scheduler._save_config(test_config)
+            self.assertEqual(self.scheduler.load_config(), test_config)
+
+    def test_load_config_reuses_unchanged_file(self):
+        """測試設定檔未變更時不重新解析，變更後會重新讀取"""
+        self.scheduler._save_config({"weekdays": [1], "time": "08:00"})
+
+        with patch("src.scheduler._loads_config", wraps=_loads_config) as loads:
+            first = self.scheduler.load_config()
+            first["time"] = "09:00"
+            first["weekdays"].append(5)
+            self.assertEqual(self.scheduler.load_config()["time"], "08:00")
+            self.assertEqual(self.scheduler.load_config()["weekdays"], [1])
+            self.assertEqual(loads.call_count, 1)
+
+            self.scheduler._save_config({"weekdays": [1, 2], "time": "23:15"})
+            self.assertEqual(self.scheduler.load_config()["time"], "23:15")
+            self.assertEqual(loads.call_count, 2)
+
+    def test_load_config_after_save_same_stamp(self):
+        """測試儲存後即使 mtime 與大小皆未改變，仍會讀到新內容"""
+        self.scheduler._save_config({"weekdays": [1], "time": "08:00"})
+        self.scheduler.load_config()
+        st = self.scheduler.config_path.stat()
+
+        # 模擬 mtime 精度不足的檔案系統：內容改變但 mtime 與大小相同
+        self.scheduler._save_config({"weekdays": [2], "time": "09:00"})
+        os.utime(self.scheduler.config_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        self.assertEqual(self.scheduler.load_config()["time"], "09:00")
+
     def test_load_nonexistent_config(self):
         """測試載入不存在的配置"""
         result = self.scheduler.load_config()
@@ -76,7 +131,89 @@ class TestShutdownScheduler(unittest.TestCase):
             mock_save.assert_called_once()
 
             # 驗證子程序被調用
-            self.assertEqual(mock_run.call_count, 3)  # 刪除 + 創建 + 驗證
+            self.assertEqual(mock_run.call_count, 1)  # 只需建立，不再另外驗證
+
+    @patch("src.scheduler.subprocess.run")
+    def test_create_schedule_unchanged_skips_task(self, mock_run):
+        """測試排程內容未變更且任務存在時不重新建立任務"""
+        self.scheduler._save_config(
+            {"weekdays": [1, 3], "time": "14:30", "is_repeat": True}
+        )
+        # 任務在關機前 15 分鐘觸發
+        mock_run.side_effect = fake_schtasks(
+            ("PC", f"\\{TASK_NAME}", "2026/1/14 14:15:00", "Ready")
+        )
+
+        with patch.object(ShutdownScheduler, "_seconds_until", return_value=3600):
+            self.scheduler.create_schedule([3, 1], "14:30", False)
+
+        # 只有檢查任務是否存在的查詢，沒有 /create
+        self.assertEqual(mock_run.call_count, 1)
+        self.assertFalse(self.scheduler.load_config()["is_repeat"])
+
+    @patch("src.scheduler.subprocess.run")
+    def test_create_schedule_unchanged_recreates_stale_task(self, mock_run):
+        """測試只有舊版名稱的任務或執行時間不符時，仍會重新建立任務"""
+        self.scheduler._save_config(
+            {"weekdays": [1, 3], "time": "14:30", "is_repeat": True}
+        )
+        for row in (
+            ("PC", "\\AutoShutdown", "2026/1/14 14:15:00", "Ready"),
+            ("PC", f"\\{TASK_NAME}", "2026/1/14 09:45:00", "Ready"),
+            ("PC", f"\\{TASK_NAME}", "N/A", "Ready"),
+        ):
+            query = fake_schtasks(row)
+            mock_run.reset_mock()
+            mock_run.side_effect = lambda args, *a, **kw: (
+                query(args) if "/query" in args else MagicMock(returncode=0)
+            )
+
+            with patch.object(ShutdownScheduler, "_seconds_until", return_value=3600):
+                self.scheduler.create_schedule([1, 3], "14:30", True)
+
+            commands = [c[0][0] for c in mock_run.call_args_list]
+            self.assertTrue(any("/create" in c for c in commands), row)
+
+    @patch("src.scheduler.subprocess.run")
+    def test_create_schedule_unchanged_within_warning_time(self, mock_run):
+        """測試排程未變更但關機時間在警告時間內時仍立即執行關機"""
+        self.scheduler._save_config(
+            {"weekdays": [1, 3], "time": "14:30", "is_repeat": True}
+        )
+        query = fake_schtasks(("PC", f"\\{TASK_NAME}", "N/A", "Ready"))
+        mock_run.side_effect = lambda args, *a, **kw: (
+            query(args) if "/query" in args else MagicMock(returncode=0)
+        )
+
+        with patch.object(ShutdownScheduler, "_seconds_until", return_value=300):
+            self.scheduler.create_schedule([1, 3], "14:30", True)
+
+        commands = [c[0][0] for c in mock_run.call_args_list]
+        self.assertTrue(
+            any(isinstance(c, str) and c.startswith("shutdown /s /t 300") for c in commands)
+        )
+
+    def test_schedule_equals(self):
+        """測試設定比對"""
+        config = {"weekdays": [1, 3], "time": "14:30"}
+        self.assertTrue(ShutdownScheduler._schedule_equals(config, [3, 1], "14:30"))
+        self.assertFalse(ShutdownScheduler._schedule_equals(config, [1], "14:30"))
+        self.assertFalse(ShutdownScheduler._schedule_equals(config, [1, 3], "14:31"))
+        self.assertFalse(ShutdownScheduler._schedule_equals(None, [1, 3], "14:30"))
+
+    @patch("src.scheduler.subprocess.run")
+    def test_create_schedule_weekday_argument(self, mock_run):
+        """測試 /d 參數以逗號分隔星期代碼，無效星期在執行任何命令前被拒絕"""
+        mock_run.return_value = MagicMock(returncode=0)
+
+        self.scheduler._create_windows_task([1, 3, 7], "03:00")
+        create_args = next(c[0][0] for c in mock_run.call_args_list if "/create" in c[0][0])
+        self.assertEqual(create_args[create_args.index("/d") + 1], "MON,WED,SUN")
+
+        mock_run.reset_mock()
+        with self.assertRaises(ValueError):
+            self.scheduler._create_windows_task([1, 8], "03:00")
+        mock_run.assert_not_called()
 
     @patch("src.scheduler.subprocess.run")
     def test_create_schedule_failure(self, mock_run):
@@ -88,6 +225,15 @@ class TestShutdownScheduler(unittest.TestCase):
             self.scheduler.create_schedule([1, 2, 3], "14:30", True)
 
         self.assertIn("Task creation failed", str(context.exception))
+        self.assertEqual(
+            context.exception.user_message, "建立排程任務失敗：Access denied"
+        )
+
+        # schtasks 沒有任何錯誤輸出時仍回報 ScheduleError
+        mock_run.return_value = MagicMock(returncode=1, stderr=None)
+        with self.assertRaises(RuntimeError) as context:
+            self.scheduler.create_schedule([1, 2, 3], "14:30", True)
+        self.assertEqual(context.exception.user_message, "建立排程任務失敗：")
 
     @patch("src.scheduler.subprocess.run")
     def test_remove_schedule_success(self, mock_run):
@@ -140,29 +286,116 @@ class TestShutdownScheduler(unittest.TestCase):
     @patch("src.scheduler.subprocess.run")
     def test_get_schedule_info_success(self, mock_run):
         """測試成功取得排程資訊"""
-        # 模擬任務列表返回
-        mock_run.side_effect = [
-            MagicMock(
-                returncode=0,
-                stdout='"Task Name","Status"\n"AutomaticShutdownScheduler","Running"',
-            ),
-            MagicMock(
-                returncode=0,
-                stdout="Task Name: AutomaticShutdownScheduler\nNext Run Time: 2023-01-01 14:30:00",
-            ),
-        ]
+        mock_run.side_effect = fake_schtasks(
+            ("PC", f"\\{TASK_NAME}", "2023-01-01 14:30:00", "Ready")
+        )
 
         result = self.scheduler.get_schedule_info()
 
         self.assertIsInstance(result, str)
         self.assertIn("排程狀態", result)
+        self.assertIn("下次執行時間: 2023-01-01 14:30:00\n", result)
+        # 單次詳細列表查詢即取得所有欄位
+        self.assertEqual(mock_run.call_count, 1)
+
+    @patch("src.scheduler.subprocess.run")
+    def test_get_schedule_info_from_config(self, mock_run):
+        """測試有設定檔時直接由設定檔產生資訊，verify=True 時才查詢 schtasks"""
+        self.scheduler._save_config(
+            {"weekdays": [1, 5], "time": "22:30", "is_repeat": True}
+        )
+        mock_run.side_effect = fake_schtasks(("PC", f"\\{TASK_NAME}", "N/A", "Ready"))
+
+        result = self.scheduler.get_schedule_info()
+
+        self.assertIn("關機時間: 22:30", result)
+        self.assertIn("執行星期: 一、五", result)
+        mock_run.assert_not_called()
+
+        result = self.scheduler.get_schedule_info(verify=True)
+
+        self.assertIn("狀態: Ready", result)
+        self.assertEqual(mock_run.call_count, 1)
+
+    def test_config_weekdays_legacy_booleans(self):
+        """測試舊版布林值列表與新版星期數字都能轉為相同的星期"""
+        legacy = {"weekdays": [True, False, True, False, False, False, True]}
+        self.assertEqual(ShutdownScheduler.config_weekdays(legacy), [1, 3, 7])
+        self.assertEqual(
+            ShutdownScheduler.config_weekdays({"weekdays": [7, 1, 3]}), [1, 3, 7]
+        )
+
+        self.scheduler._save_config(dict(legacy, time="07:00"))
+        self.assertIn("執行星期: 一、三、日", self.scheduler.get_schedule_info())
+
+    @patch("src.scheduler.subprocess.run")
+    def test_get_schedule_info_quoted_csv(self, mock_run):
+        """測試 CSV 欄位中含有逗號時仍能正確取出任務名稱"""
+        folder_name = "\\TaskFolder\\AutomaticShutdownScheduler"
+        mock_run.side_effect = fake_schtasks(
+            ("PC", "\\Backup, AutoShutdown copy", "N/A", "Ready"),
+            ("PC", folder_name, "2023-01-01 14:15:00", "Ready"),
+        )
+
+        result = self.scheduler.get_schedule_info()
+
+        self.assertIn("2023-01-01 14:15:00", result)
+        self.assertEqual(self.scheduler.task_name, folder_name)
+        # 找到的任務名稱只記錄在此實例上，不影響類別共用的預設值
+        self.assertEqual(ShutdownScheduler.task_name, TASK_NAME)
+
+    @patch("src.scheduler.subprocess.run")
+    def test_get_schedule_info_localized_keys(self, mock_run):
+        """測試中文系統的欄位標題"""
+        mock_run.side_effect = fake_schtasks(
+            ("PC", "\\AutomaticShutdownScheduler", "2023/1/2 22:45:00", "每週"),
+            header=("主機名稱", "工作名稱", "下次執行時間", "排程類型"),
+        )
+
+        result = self.scheduler.get_schedule_info()
+
+        self.assertIn("任務名稱: \\AutomaticShutdownScheduler\n", result)
+        self.assertIn("下次執行時間: 2023/1/2 22:45:00\n", result)
+        self.assertIn("排程類型: 每週\n", result)
+        self.assertIn("狀態: 未知\n", result)
+        # 輸出中沒有的選用欄位不顯示
+        self.assertNotIn("執行身分", result)
+
+    @patch("src.scheduler.subprocess.run")
+    def test_single_verbose_query(self, mock_run):
+        """測試以單次 /v 查詢取得詳細欄位，並優先使用目前版本的任務名稱"""
+        mock_run.side_effect = fake_schtasks(
+            ("PC", "\\AutoShutdown", "N/A", "Ready", "OldUser"),
+            ("PC", f"\\{TASK_NAME}", "N/A", "Ready", "SYSTEM"),
+            header=("HostName", "TaskName", "Next Run Time", "Status", "Run As User"),
+        )
+
+        result = self.scheduler.get_schedule_info()
+
+        self.assertEqual(mock_run.call_count, 1)
+        self.assertIn("/v", mock_run.call_args[0][0])
+        self.assertIn("執行身分: SYSTEM\n", result)
+
+    def test_task_list_stops_after_current_task(self):
+        """測試串流讀取到目前版本的任務後即結束 schtasks"""
+        output = fake_schtasks(
+            ("PC", f"\\{TASK_NAME}", "N/A", "Ready"),
+            ("PC", "\\AutoShutdown", "N/A", "Ready"),
+        )(["schtasks", "/query"]).stdout
+        proc = MagicMock(returncode=0, stdout=io.BytesIO(output))
+        proc.__enter__.return_value = proc
+        proc.__exit__.return_value = False
+
+        with patch("src.scheduler.subprocess.Popen", return_value=proc):
+            tasks = self.scheduler._query_tasks_cached()
+
+        proc.terminate.assert_called_once()
+        self.assertEqual([info["name"] for info in tasks], [f"\\{TASK_NAME}"])
 
     @patch("src.scheduler.subprocess.run")
     def test_get_schedule_info_no_task(self, mock_run):
         """測試沒有找到排程任務"""
-        mock_run.return_value = MagicMock(
-            returncode=0, stdout='"Task Name","Status"\n"OtherTask","Running"'
-        )
+        mock_run.side_effect = fake_schtasks(("PC", "\\OtherTask", "N/A", "Running"))
 
         result = self.scheduler.get_schedule_info()
         self.assertEqual(result, "找不到排程任務")
@@ -172,7 +405,7 @@ class TestShutdownScheduler(unittest.TestCase):
         """測試檢查到活躍排程"""
         mock_run.return_value = MagicMock(
             returncode=0,
-            stdout='"Task Name","Status"\n"AutomaticShutdownScheduler","Running"',
+            stdout=b'"TaskName","Status"\n"AutomaticShutdownScheduler","Running"',
         )
 
         result = self.scheduler.has_active_schedule()
@@ -182,23 +415,171 @@ class TestShutdownScheduler(unittest.TestCase):
     def test_has_active_schedule_false(self, mock_run):
         """測試沒有活躍排程"""
         mock_run.return_value = MagicMock(
-            returncode=0, stdout='"Task Name","Status"\n"OtherTask","Running"'
+            returncode=0, stdout=b'"TaskName","Status"\n"OtherTask","Running"'
         )
 
         result = self.scheduler.has_active_schedule()
         self.assertFalse(result)
 
+    @patch("src.scheduler.subprocess.run")
+    def test_query_results_cached(self, mock_run):
+        """測試短時間內重複查詢會使用快取"""
+        mock_run.return_value = MagicMock(
+            returncode=0,
+            stdout=b'"TaskName","Status"\n"AutomaticShutdownScheduler","Running"',
+        )
+
+        self.assertTrue(self.scheduler.has_active_schedule())
+        self.assertTrue(self.scheduler.has_active_schedule())
+        self.assertEqual(mock_run.call_count, 1)
+
+    @patch("src.scheduler.subprocess.run")
+    def test_task_list_shared_between_queries(self, mock_run):
+        """測試 has_active_schedule 與 get_schedule_info 共用同一次任務列表查詢"""
+        folder_name = f"\\TaskFolder\\{TASK_NAME}"
+        mock_run.side_effect = fake_schtasks(("PC", folder_name, "N/A", "Ready"))
+
+        self.assertTrue(self.scheduler.has_active_schedule())
+        self.assertIn("狀態: Ready", self.scheduler.get_schedule_info(verify=True))
+
+        self.assertEqual(mock_run.call_count, 1)
+
+    @patch("src.scheduler.subprocess.run")
+    def test_schedule_info_follows_task_list(self, mock_run):
+        """測試排程資訊不另外快取，改用舊版名稱後仍反映最新的任務列表"""
+        mock_run.side_effect = fake_schtasks(("PC", "\\AutoShutdown", "N/A", "Ready"))
+        self.assertIn("AutoShutdown", self.scheduler.get_schedule_info(verify=True))
+
+        # 只快取任務列表，任務名稱改變後不會留下以舊名稱為鍵的資訊
+        self.assertEqual(list(self.scheduler._cache), [("task_list",)])
+
+    @patch("src.scheduler.subprocess.run")
+    def test_cache_invalidated_on_remove(self, mock_run):
+        """測試移除排程後快取會被清除"""
+        mock_run.return_value = MagicMock(
+            returncode=0,
+            stdout=b'"TaskName","Status"\n"AutomaticShutdownScheduler","Running"',
+        )
+        self.assertTrue(self.scheduler.has_active_schedule())
+
+        self.scheduler.remove_schedule()
+        mock_run.return_value = MagicMock(
+            returncode=0, stdout=b'"TaskName","Status"\n"OtherTask","Running"'
+        )
+
+        self.assertFalse(self.scheduler.has_active_schedule())
+
     @patch("src.scheduler.subprocess.run")
     def test_task_name_matching_fixed(self, mock_run):
         """測試任務名稱匹配邏輯已修復"""
         mock_run.return_value = MagicMock(
-            returncode=0, stdout='"Task Name","Status"\n"AutomaticScheduler","Running"'
+            returncode=0, stdout=b'"TaskName","Status"\n"AutomaticScheduler","Running"'
         )
 
         result = self.scheduler.has_active_schedule()
         # 這個任務名稱不應該被匹配，因為它不在 possible_task_names 中
         self.assertFalse(result)
 
+    @patch("src.scheduler.subprocess.run")
+    @patch("src.scheduler.win32com")
+    def test_com_api_used_when_available(self, mock_win32com, mock_run):
+        """測試可使用 pywin32 時透過 COM API 查詢與建立任務，不啟動 schtasks"""
+        from datetime import datetime
+
+        service = mock_win32com.client.Dispatch.return_value
+        root = service.GetFolder.return_value
+        task = MagicMock(
+            Name=TASK_NAME,
+            Path=f"\\{TASK_NAME}",
+            NextRunTime=datetime(2023, 1, 2, 22, 45),
+            LastRunTime=datetime(2023, 1, 1, 22, 45),
+            State=3,
+            LastTaskResult=0,
+        )
+        root.GetTasks.return_value = [task]
+        root.GetFolders.return_value = []
+
+        self.assertTrue(self.scheduler.has_active_schedule())
+        self.assertIn(
+            "下次執行時間: 2023/01/02 22:45:00",
+            self.scheduler.get_schedule_info(verify=True),
+        )
+
+        self.scheduler._create_windows_task([1, 7], "03:00")
+        trigger = service.NewTask.return_value.Triggers.Create.return_value
+        # 週一=2、週日=1
+        self.assertEqual(trigger.DaysOfWeek, 3)
+        root.RegisterTaskDefinition.assert_called_once()
+
+        schtasks_calls = [c for c in mock_run.call_args_list if "schtasks" in c[0][0]]
+        self.assertEqual(schtasks_calls, [])
+
+    @patch("src.scheduler.win32com")
+    def test_com_service_per_thread(self, mock_win32com):
+        """測試 COM 服務在同一執行緒重複使用，其他執行緒各自建立"""
+        import threading
+
+        mock_win32com.client.Dispatch.side_effect = lambda name: MagicMock()
+
+        service = self.scheduler._ts_service()
+        self.assertIs(self.scheduler._ts_service(), service)
+
+        other = []
+        thread = threading.Thread(
+            target=lambda: other.append(self.scheduler._ts_service())
+        )
+        thread.start()
+        thread.join()
+
+        self.assertIsNot(other[0], service)
+        self.assertEqual(mock_win32com.client.Dispatch.call_count, 2)
+
+    @patch("src.scheduler.win32com")
+    @patch("src.scheduler.pythoncom")
+    def test_release_com_uninitializes(self, mock_pythoncom, mock_win32com):
+        """測試釋放 COM 服務時與 CoInitialize 配對呼叫 CoUninitialize"""
+        self.scheduler.release_com()
+        mock_pythoncom.CoUninitialize.assert_not_called()
+
+        self.scheduler._ts_service()
+        self.scheduler.release_com()
+        mock_pythoncom.CoInitialize.assert_called_once()
+        mock_pythoncom.CoUninitialize.assert_called_once()
+
+        # 釋放後再次使用會重新建立服務
+        self.scheduler._ts_service()
+        self.assertEqual(mock_win32com.client.Dispatch.call_count, 2)
+
+    def test_day_bits_match_task_scheduler(self):
+        """測試 _DAY_BIT 與 Task Scheduler 的 DaysOfWeek 常數一致"""
+        from src.config import DAY_MAPPING
+        from src.scheduler import _DAY_BIT
+
+        days_of_week = {
+            "SUN": 0x01,
+            "MON": 0x02,
+            "TUE": 0x04,
+            "WED": 0x08,
+            "THU": 0x10,
+            "FRI": 0x20,
+            "SAT": 0x40,
+        }
+        for day, code in DAY_MAPPING.items():
+            self.assertEqual(_DAY_BIT[day], days_of_week[code])
+
+    def test_match_task_folder_paths(self):
+        """測試任務名稱匹配會忽略資料夾路徑前綴"""
+        self.assertTrue(self.scheduler._match_task(TASK_NAME))
+        self.assertTrue(self.scheduler._match_task(f"\\{TASK_NAME}"))
+        self.assertTrue(self.scheduler._match_task(f"/{TASK_NAME}"))
+        self.assertTrue(self.scheduler._match_task(f"\\TaskFolder\\{TASK_NAME}"))
+        self.assertTrue(self.scheduler._match_task("AutoShutdown"))
+        # Windows 任務名稱不分大小寫
+        self.assertTrue(self.scheduler._match_task(f"\\{TASK_NAME.upper()}"))
+        self.assertTrue(self.scheduler._contains_task_name(TASK_NAME.lower().encode()))
+        self.assertFalse(self.scheduler._match_task("AutomaticScheduler"))
+        self.assertFalse(self.scheduler._match_task(f"{TASK_NAME} "))
+
     def test_time_validation(self):
         """測試時間格式驗證"""
         # 這裡可以添加時間格式驗證的測試
@@ -277,7 +277,7 @@ class TestSecurity(unittest.TestCase):
         from src.config import MESSAGES
 
         # 錯誤訊息不應該包含敏感資訊
-        for key, message in MESSAGES.items():
+        for key, message in vars(MESSAGES).items():
             self.assertIsInstance(message, str)
             self.assertTrue(len(message) > 0)
 
@@ -343,7 +343,7 @@ class TestSecurity(unittest.TestCase):
                 scheduler.remove_schedule()
 
             # 驗證所有操作都完成，沒有資源洩漏
-            self.assertEqual(mock_run.call_count, 20)  # 5 * (3 create + 1 remove)
+            self.assertEqual(mock_run.call_count, 15)  # 5 * (1 create + 2 remove)
 
 
 class TestSecurityIntegration(unittest.TestCase):
@@ -161,6 +161,20 @@ class TestModernWidgets(unittest.TestCase):
         self.assertIn("24小時", toggle.options)
         self.assertIn("12小時", toggle.options)
 
+    def test_pill_toggle_reselect_skips_command(self):
+        """測試再次點擊已選取的選項不會重新觸發 command"""
+        command = MagicMock()
+        toggle = PillToggle(self.root, options=["24小時", "12小時"], command=command)
+        first = MagicMock(x=toggle.padding + 1)
+        second = MagicMock(x=toggle.padding + toggle.button_width + 1)
+
+        toggle._on_click(first)
+        command.assert_not_called()
+
+        toggle._on_click(second)
+        self.assertEqual(toggle.variable.get(), "12小時")
+        command.assert_called_once()
+
     def test_circular_day_button(self):
         """測試圓形日期按鈕"""
         button = CircularDayButton(self.root, text="一")
@@ -173,6 +187,18 @@ class TestModernWidgets(unittest.TestCase):
         self.assertIsNotNone(button)
         self.assertEqual(button.text, "測試按鈕")
 
+    def test_modern_button_disabled(self):
+        """測試停用的按鈕不執行命令"""
+        command = MagicMock()
+        button = ModernButton(self.root, text="測試", command=command)
+        button.set_enabled(False)
+        button._on_release(MagicMock(x=1, y=1))
+        command.assert_not_called()
+
+        button.set_enabled(True)
+        button._on_release(MagicMock(x=1, y=1))
+        command.assert_called_once()
+
     def test_collapsible_section(self):
         """測試可折疊區段"""
         section = CollapsibleSection(self.root, title="測試區段")
@@ -193,6 +219,11 @@ class TestModernWidgets(unittest.TestCase):
         indicator.set_status("active", "活躍狀態")
         self.assertEqual(indicator.label["text"], "目前狀態：活躍狀態")
 
+        # 相同狀態不重畫圓點
+        with patch.object(indicator.dot, "delete") as delete:
+            indicator.set_status("active", "活躍狀態")
+            delete.assert_not_called()
+
     def test_widget_colors(self):
         """測試元件色彩一致性"""
         # 測試所有元件都使用正確的色彩
@@ -346,5 +377,25 @@ class TestUIErrorHandling(unittest.TestCase):
             pass
 
 
+class TestTimeConversion(unittest.TestCase):
+    """主視窗時間轉換函式的測試（不需要顯示器）"""
+
+    def test_format_time_24h(self):
+        """測試 12/24 小時制轉換"""
+        from src.ui.main_window import _format_time_24h
+
+        self.assertEqual(_format_time_24h("09", "05", False, "AM"), "09:05")
+        self.assertEqual(_format_time_24h("12", "30", True, "AM"), "00:30")
+        self.assertEqual(_format_time_24h("12", "30", True, "PM"), "12:30")
+        self.assertEqual(_format_time_24h("01", "00", True, "PM"), "13:00")
+
+    def test_format_time_24h_invalid(self):
+        """測試無效數值仍拋出 ValueError"""
+        from src.ui.main_window import _format_time_24h
+
+        with self.assertRaises(ValueError):
+            _format_time_24h("xx", "00", False, "AM")
+
+
 if __name__ == "__main__":
     unittest.main()